@@ -4,229 +4,517 @@ Example: Analyze GCP Assessment Results
 This script demonstrates how to analyze the CSV outputs from the GCP Assessment Suite.
 """
 
+import concurrent.futures
+import numpy as np
 import pandas as pd
-import glob
 import json
+import os
+import sys
 from datetime import datetime
 
+# Optional: numba lets the compute summary run as one fused machine-code
+# pass over the raw arrays instead of several pandas passes.
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Optional: polars parses CSVs in parallel and is noticeably faster on the
+# multi-MB inventory files the assessment suite produces. Fall back to the
+# pyarrow engine, then to the default pandas parser, so the script keeps
+# working with plain pandas installed.
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+def _read_csv(path, columns=None, numeric=()):
+    """Read a CSV into a pandas DataFrame using the fastest available parser.
+
+    With polars installed this goes through a lazy scan, so the query
+    optimizer pushes the column projection down into the parser and only
+    the columns the reports use are ever parsed. The result is collected
+    back to pandas so the report code stays unchanged.
+
+    Known numeric columns are declared to the parser so it writes float64
+    straight into typed buffers, with 'N/A' mapped to NaN during the
+    parse — no object-dtype intermediate and no post-hoc coercion.
+    Overrides for columns a particular export lacks are ignored.
+    """
+    if pl is not None:
+        # null_values matches the pandas default of reading 'N/A' as NaN
+        lf = pl.scan_csv(path, null_values=['N/A'],
+                         schema_overrides={c: pl.Float64 for c in numeric})
+        if columns is not None:
+            available = lf.collect_schema().names()
+            wanted = [c for c in columns if c in available]
+            if wanted:
+                lf = lf.select(wanted)
+        return lf.collect().to_pandas(use_pyarrow_extension_array=True)
+    try:
+        # Memory-map the file and parse it with Arrow's multithreaded CSV
+        # reader, then hand the columnar buffers to pandas as Arrow-backed
+        # arrays. The mapping shares the page cache with the parser and
+        # the to_pandas conversion avoids copying the column data, so
+        # repeat runs against a warm file skip most of the I/O cost.
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+        with pa.memory_map(path, 'r') as source:
+            table = pacsv.read_csv(
+                source,
+                read_options=pacsv.ReadOptions(use_threads=True),
+                convert_options=pacsv.ConvertOptions(
+                    null_values=['', 'N/A'],
+                    strings_can_be_null=True,
+                    column_types={c: pa.float64() for c in numeric}))
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    except ImportError:
+        dtype = {c: 'float64' for c in numeric}
+        return pd.read_csv(path, dtype=dtype, na_values=['N/A'])
+
+# Filename prefix of each assessment table's CSV export.
+CSV_PREFIXES = {
+    'compute': 'gcp_compute_inventory_',
+    'storage': 'gcp_storage_usage_',
+    'gke': 'gcp_gke_clusters_',
+    'vpcs': 'gcp_networking_vpcs_',
+}
+
+def _find_latest_csvs():
+    """Locate the newest CSV for each assessment table in one directory scan.
+
+    Replaces four glob.glob calls that each walked the directory — and
+    whose [0] pick was alphabetical, so re-running an assessment could
+    leave the analysis silently reading a stale export. os.scandir
+    caches stat results, so the mtime comparison costs no extra syscalls.
+    """
+    latest = {}
+    for entry in os.scandir('.'):
+        name = entry.name
+        if not name.endswith('.csv'):
+            continue
+        for kind, prefix in CSV_PREFIXES.items():
+            if name.startswith(prefix):
+                best = latest.get(kind)
+                if best is None or entry.stat().st_mtime > best.stat().st_mtime:
+                    latest[kind] = entry
+                break
+    return {kind: entry.path for kind, entry in latest.items()}
+
+# Columns each report actually reads, so re-analysis runs can load just
+# these from the Parquet sidecar instead of re-parsing the whole CSV.
+NEEDED_COLS = {
+    'compute': ['status', 'machine_type', 'region', 'vcpus', 'memory_gb',
+                'total_storage_gb', 'os_family', 'storage_types', 'labels',
+                'preemptible', 'deletion_protection'],
+    'storage': ['storage_class', 'total_size_gb', 'total_size_tb', 'object_count'],
+    'gke': ['node_count', 'total_vcpus', 'total_memory_gb'],
+    'vpcs': None,  # only the row count is reported
+}
+
+# Columns the parser should type as float64 up front ('N/A' → NaN).
+NUMERIC_COLS = {
+    'compute': ('vcpus', 'memory_gb', 'total_storage_gb'),
+    'storage': ('total_size_gb', 'total_size_tb', 'object_count'),
+    'gke': ('node_count', 'total_vcpus', 'total_memory_gb'),
+}
+
+# Low-cardinality columns worth dictionary-encoding: comparisons and
+# value_counts run on small integer codes instead of per-row strings.
+CATEGORICAL_COLS = {
+    'compute': ('status', 'machine_type', 'region', 'os_family'),
+    'storage': ('storage_class',),
+}
+
+def _load_table(kind, path):
+    """Load one assessment table, preferring a Parquet sidecar of the CSV.
+
+    CSV is row-oriented text and has to be fully re-parsed on every run;
+    Parquet is columnar, so repeat analyses only read the columns the
+    reports touch. The sidecar is rebuilt whenever the CSV is newer.
+    Requires pyarrow; without it this falls back to plain CSV loading.
+    """
+    sidecar = path + '.parquet'
+    df = None
+    try:
+        if os.path.exists(sidecar) and os.path.getmtime(sidecar) >= os.path.getmtime(path):
+            columns = NEEDED_COLS.get(kind)
+            if columns is not None:
+                import pyarrow.parquet as pq
+                available = pq.read_schema(sidecar).names
+                columns = [c for c in columns if c in available]
+            df = pd.read_parquet(sidecar, columns=columns)
+    except (ImportError, OSError):
+        pass
+
+    if df is None:
+        df = _read_csv(path, NEEDED_COLS.get(kind), NUMERIC_COLS.get(kind, ()))
+        try:
+            df.to_parquet(sidecar, compression='zstd')
+        except (ImportError, OSError):
+            pass
+
+    for col in CATEGORICAL_COLS.get(kind, ()):
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+
+    if kind == 'compute':
+        _prepare_compute(df)
+    elif kind == 'storage':
+        _prepare_storage(df)
+    return df
+
+def _prepare_storage(df):
+    """Coerce bucket sizes to float64 once at load time.
+
+    Threshold checks like the 1TB lifecycle scan then reduce to a single
+    vectorized compare instead of a string round-trip per run.
+    """
+    if 'total_size_gb' in df.columns:
+        df['total_size_gb'] = pd.to_numeric(df['total_size_gb'], errors='coerce').fillna(0)
+
+def _prepare_compute(df):
+    """Tokenize compute columns once so the opportunity checks are cheap.
+
+    The optimization scans used to substring-search the raw labels string
+    per check; extracting the environment label into a category column up
+    front turns those into integer equality compares. The boolean-ish
+    flag columns are normalized to real bools at the same time.
+    """
+    if 'labels' in df.columns:
+        # labels holds the json.dumps() of the instance label map, so the
+        # env value sits in '"env": "development"' form (quotes included).
+        df['_env'] = (df['labels'].astype(str)
+                      .str.extract(r'"env(?:ironment)?"\s*:\s*"(\w+)"', expand=False)
+                      .astype('category'))
+    for col in ('preemptible', 'deletion_protection'):
+        if col in df.columns:
+            df[col] = df[col].astype(str).eq('True')
+
+# value_counts results keyed by (DataFrame identity, column). The report
+# functions ask for several of the same distributions, and each
+# value_counts is a full O(N) pass, so compute each one once.
+_vc_cache = {}
+
+def _value_counts(df, col):
+    """Memoized df[col].value_counts()."""
+    key = (id(df), col)
+    counts = _vc_cache.get(key)
+    if counts is None:
+        counts = _vc_cache[key] = df[col].value_counts()
+    return counts
+
+def _format_counts(counts, fmt):
+    """Render '  key: value' lines for a counts Series as one string.
+
+    Drops the N/A bucket with a single vectorized index compare and joins
+    all lines in one pass, replacing the per-row .items() loops that each
+    re-entered the Python interpreter per printed line.
+    """
+    counts = counts[counts.index != 'N/A']
+    return "\n".join(fmt.format(k, v) for k, v in zip(counts.index, counts.to_numpy()))
+
+def _get_table(data, kind):
+    """Return the table for a report section, or None if absent or empty.
+
+    Lets every section short-circuit in one check instead of walking its
+    sub-blocks against a zero-row frame.
+    """
+    df = data.get(kind)
+    if df is None or len(df) == 0:
+        return None
+    return df
+
+def _numeric_totals(df, cols):
+    """Sum several possibly-'N/A' columns in one fused aggregation pass.
+
+    pd.to_numeric(errors='coerce') turns the placeholders into NaN and the
+    sums skip them, all in C — no object-dtype string round-trip, and one
+    agg pass instead of one full-column scan per metric. Columns missing
+    from the CSV are simply absent from the returned Series.
+    """
+    cols = [c for c in cols if c in df.columns]
+    return df[cols].apply(pd.to_numeric, errors='coerce').sum()
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _fused_compute_kernel(vcpus, mem, stor, status_codes, running_code,
+                              os_codes, n_os):
+        total_v = total_m = total_s = 0.0
+        running = 0
+        os_hist = np.zeros(n_os, dtype=np.int64)
+        for i in range(vcpus.shape[0]):
+            v = vcpus[i]
+            if not np.isnan(v):
+                total_v += v
+            m = mem[i]
+            if not np.isnan(m):
+                total_m += m
+            s = stor[i]
+            if not np.isnan(s):
+                total_s += s
+            if status_codes[i] == running_code:
+                running += 1
+            c = os_codes[i]
+            if c >= 0:
+                os_hist[c] += 1
+        return total_v, total_m, total_s, running, os_hist
+
+_COMPUTE_NUMERIC = ('vcpus', 'memory_gb', 'total_storage_gb')
+
+def _compute_summary(df):
+    """Aggregate everything the compute summary prints.
+
+    Returns (running_count, numeric totals Series, os_family counts).
+    With numba installed and all columns present, the totals, RUNNING
+    count, and OS histogram come out of a single jitted pass over the
+    underlying arrays; otherwise the fused pandas aggregation is used.
+    """
+    cols = set(df.columns)
+    if (numba is not None
+            and cols >= {'status', 'os_family', *_COMPUTE_NUMERIC}
+            and isinstance(df['status'].dtype, pd.CategoricalDtype)
+            and isinstance(df['os_family'].dtype, pd.CategoricalDtype)):
+        status = df['status'].cat
+        os_fam = df['os_family'].cat
+        # NaN statuses encode as -1, so the no-RUNNING sentinel must be a
+        # value no category code (or missing value) can take.
+        running_code = (status.categories.get_loc('RUNNING')
+                        if 'RUNNING' in status.categories else -2)
+        arrays = [pd.to_numeric(df[c], errors='coerce')
+                    .to_numpy(dtype='float64', na_value=np.nan)
+                  for c in _COMPUTE_NUMERIC]
+        tv, tm, ts, running, os_hist = _fused_compute_kernel(
+            *arrays,
+            status.codes.to_numpy(np.int64), running_code,
+            os_fam.codes.to_numpy(np.int64), len(os_fam.categories))
+        totals = pd.Series([tv, tm, ts], index=list(_COMPUTE_NUMERIC))
+        os_dist = pd.Series(os_hist, index=os_fam.categories).sort_values(ascending=False)
+        return running, totals, os_dist
+
+    running = int(_value_counts(df, 'status').get('RUNNING', 0)) if 'status' in cols else 0
+    totals = _numeric_totals(df, _COMPUTE_NUMERIC)
+    os_dist = _value_counts(df, 'os_family') if 'os_family' in cols else None
+    return running, totals, os_dist
+
 def load_assessment_data():
     """Load all assessment data files."""
     data = {}
-    
+
     try:
-        # Load compute data
-        compute_files = glob.glob('gcp_compute_inventory_*.csv')
-        if compute_files:
-            data['compute'] = pd.read_csv(compute_files[0])
-            print(f"✓ Loaded compute data: {len(data['compute'])} instances")
-        
-        # Load storage data
-        storage_files = glob.glob('gcp_storage_usage_*.csv')
-        if storage_files:
-            data['storage'] = pd.read_csv(storage_files[0])
-            print(f"✓ Loaded storage data: {len(data['storage'])} buckets")
-        
-        # Load GKE data
-        gke_files = glob.glob('gcp_gke_clusters_*.csv')
-        if gke_files:
-            data['gke'] = pd.read_csv(gke_files[0])
-            print(f"✓ Loaded GKE data: {len(data['gke'])} clusters")
-        
-        # Load networking data
-        vpc_files = glob.glob('gcp_networking_vpcs_*.csv')
-        if vpc_files:
-            data['vpcs'] = pd.read_csv(vpc_files[0])
-            print(f"✓ Loaded VPC data: {len(data['vpcs'])} VPCs")
+        paths = _find_latest_csvs()
+
+        # The four tables are independent and the CSV parsers release the
+        # GIL, so loading them on a small thread pool overlaps disk reads
+        # and parse work instead of leaving cores idle.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {kind: executor.submit(_load_table, kind, path)
+                       for kind, path in paths.items()}
+            for kind, future in futures.items():
+                data[kind] = future.result()
+
+        for kind, label, unit in (('compute', 'compute data', 'instances'),
+                                  ('storage', 'storage data', 'buckets'),
+                                  ('gke', 'GKE data', 'clusters'),
+                                  ('vpcs', 'VPC data', 'VPCs')):
+            if kind in data:
+                print(f"✓ Loaded {label}: {len(data[kind])} {unit}")
             
     except Exception as e:
         print(f"Error loading data: {e}")
     
     return data
 
-def generate_executive_summary(data):
+def generate_executive_summary(data, out):
     """Generate executive summary report."""
-    print("\n" + "=" * 60)
-    print("GCP ENVIRONMENT EXECUTIVE SUMMARY")
-    print("=" * 60)
-    print(f"Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print()
+    out.append("\n" + "=" * 60)
+    out.append("GCP ENVIRONMENT EXECUTIVE SUMMARY")
+    out.append("=" * 60)
+    out.append(f"Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    out.append("")
     
     # Compute summary
-    if 'compute' in data:
-        compute_df = data['compute']
-        print("COMPUTE INFRASTRUCTURE")
-        print("-" * 30)
-        print(f"Total Instances: {len(compute_df):,}")
-        
-        running_instances = len(compute_df[compute_df['status'] == 'RUNNING'])
-        print(f"Running Instances: {running_instances:,}")
+    compute_df = _get_table(data, 'compute')
+    if compute_df is not None:
+        out.append("COMPUTE INFRASTRUCTURE")
+        out.append("-" * 30)
+        out.append(f"Total Instances: {len(compute_df):,}")
         
-        if 'vcpus' in compute_df.columns:
-            total_vcpus = compute_df['vcpus'].astype(str).str.replace('N/A', '0').astype(float).sum()
-            print(f"Total vCPUs: {total_vcpus:,.0f}")
-        
-        if 'memory_gb' in compute_df.columns:
-            total_memory = compute_df['memory_gb'].astype(str).str.replace('N/A', '0').astype(float).sum()
-            print(f"Total Memory: {total_memory:,.1f} GB")
-        
-        if 'total_storage_gb' in compute_df.columns:
-            total_storage = compute_df['total_storage_gb'].astype(str).str.replace('N/A', '0').astype(float).sum()
-            print(f"Total Storage: {total_storage:,.1f} GB")
+        running_instances, totals, os_dist = _compute_summary(compute_df)
+        out.append(f"Running Instances: {running_instances:,}")
+
+        if 'vcpus' in totals:
+            out.append(f"Total vCPUs: {totals['vcpus']:,.0f}")
+
+        if 'memory_gb' in totals:
+            out.append(f"Total Memory: {totals['memory_gb']:,.1f} GB")
+
+        if 'total_storage_gb' in totals:
+            out.append(f"Total Storage: {totals['total_storage_gb']:,.1f} GB")
         
-        print()
+        out.append("")
         
         # OS distribution
-        if 'os_family' in compute_df.columns:
-            print("Operating System Distribution:")
-            os_dist = compute_df['os_family'].value_counts()
-            for os_name, count in os_dist.head().items():
-                if os_name != 'N/A':
-                    print(f"  {os_name}: {count:,} instances")
-            print()
+        if os_dist is not None:
+            out.append("Operating System Distribution:")
+            lines = _format_counts(os_dist.head(), "  {}: {:,} instances")
+            if lines:
+                out.append(lines)
+            out.append("")
     
     # Storage summary
-    if 'storage' in data:
-        storage_df = data['storage']
-        print("STORAGE INFRASTRUCTURE")
-        print("-" * 30)
-        print(f"Total Buckets: {len(storage_df):,}")
+    storage_df = _get_table(data, 'storage')
+    if storage_df is not None:
+        out.append("STORAGE INFRASTRUCTURE")
+        out.append("-" * 30)
+        out.append(f"Total Buckets: {len(storage_df):,}")
         
-        if 'total_size_tb' in storage_df.columns:
-            total_storage_tb = storage_df['total_size_tb'].astype(str).str.replace('N/A', '0').astype(float).sum()
-            print(f"Total Storage: {total_storage_tb:.2f} TB")
-        
-        if 'object_count' in storage_df.columns:
-            total_objects = storage_df['object_count'].astype(str).str.replace('N/A', '0').astype(float).sum()
-            print(f"Total Objects: {total_objects:,.0f}")
+        storage_totals = _numeric_totals(storage_df, ('total_size_tb', 'object_count'))
+        if 'total_size_tb' in storage_totals:
+            out.append(f"Total Storage: {storage_totals['total_size_tb']:.2f} TB")
+
+        if 'object_count' in storage_totals:
+            out.append(f"Total Objects: {storage_totals['object_count']:,.0f}")
         
-        print()
+        out.append("")
         
         # Storage by class
         if 'storage_class' in storage_df.columns:
-            print("Storage by Class:")
-            storage_by_class = storage_df.groupby('storage_class')['total_size_gb'].sum()
-            for storage_class, size_gb in storage_by_class.items():
-                if storage_class != 'N/A':
-                    print(f"  {storage_class}: {size_gb:,.1f} GB")
-            print()
+            out.append("Storage by Class:")
+            class_col = storage_df['storage_class']
+            if isinstance(class_col.dtype, pd.CategoricalDtype):
+                # One bincount over the category codes instead of a
+                # hash-based groupby with its intermediate allocations.
+                codes = class_col.cat.codes.to_numpy()
+                sizes = (pd.to_numeric(storage_df['total_size_gb'], errors='coerce')
+                         .fillna(0).to_numpy(dtype='float64'))
+                valid = codes >= 0
+                sums = np.bincount(codes[valid], weights=sizes[valid],
+                                   minlength=len(class_col.cat.categories))
+                storage_by_class = pd.Series(sums, index=class_col.cat.categories)
+            else:
+                storage_by_class = storage_df.groupby('storage_class')['total_size_gb'].sum()
+            lines = _format_counts(storage_by_class, "  {}: {:,.1f} GB")
+            if lines:
+                out.append(lines)
+            out.append("")
     
     # GKE summary
-    if 'gke' in data:
-        gke_df = data['gke']
-        print("KUBERNETES INFRASTRUCTURE")
-        print("-" * 30)
-        print(f"Total Clusters: {len(gke_df):,}")
-        
-        if 'node_count' in gke_df.columns:
-            total_nodes = gke_df['node_count'].astype(str).str.replace('N/A', '0').astype(float).sum()
-            print(f"Total Nodes: {total_nodes:,.0f}")
-        
-        if 'total_vcpus' in gke_df.columns:
-            total_k8s_vcpus = gke_df['total_vcpus'].astype(str).str.replace('N/A', '0').astype(float).sum()
-            print(f"Total K8s vCPUs: {total_k8s_vcpus:,.0f}")
+    gke_df = _get_table(data, 'gke')
+    if gke_df is not None:
+        out.append("KUBERNETES INFRASTRUCTURE")
+        out.append("-" * 30)
+        out.append(f"Total Clusters: {len(gke_df):,}")
         
-        if 'total_memory_gb' in gke_df.columns:
-            total_k8s_memory = gke_df['total_memory_gb'].astype(str).str.replace('N/A', '0').astype(float).sum()
-            print(f"Total K8s Memory: {total_k8s_memory:,.1f} GB")
+        gke_totals = _numeric_totals(gke_df, ('node_count', 'total_vcpus', 'total_memory_gb'))
+        if 'node_count' in gke_totals:
+            out.append(f"Total Nodes: {gke_totals['node_count']:,.0f}")
+
+        if 'total_vcpus' in gke_totals:
+            out.append(f"Total K8s vCPUs: {gke_totals['total_vcpus']:,.0f}")
+
+        if 'total_memory_gb' in gke_totals:
+            out.append(f"Total K8s Memory: {gke_totals['total_memory_gb']:,.1f} GB")
         
-        print()
+        out.append("")
     
     # Network summary
-    if 'vpcs' in data:
-        vpcs_df = data['vpcs']
-        print("NETWORK INFRASTRUCTURE")
-        print("-" * 30)
-        print(f"Total VPCs: {len(vpcs_df):,}")
-        print()
-
-def identify_optimization_opportunities(data):
+    vpcs_df = _get_table(data, 'vpcs')
+    if vpcs_df is not None:
+        out.append("NETWORK INFRASTRUCTURE")
+        out.append("-" * 30)
+        out.append(f"Total VPCs: {len(vpcs_df):,}")
+        out.append("")
+
+def identify_optimization_opportunities(data, out):
     """Identify cost and performance optimization opportunities."""
-    print("OPTIMIZATION OPPORTUNITIES")
-    print("=" * 40)
+    out.append("OPTIMIZATION OPPORTUNITIES")
+    out.append("=" * 40)
     
     opportunities = []
     
-    if 'compute' in data:
-        compute_df = data['compute']
-        
+    compute_df = _get_table(data, 'compute')
+    if compute_df is not None:
+        cols = set(compute_df.columns)
+
+        # Each environment/flag mask is built once up front; every check
+        # below is then a single reduction over precomputed booleans, and
+        # new checks can reuse the same masks instead of rescanning.
+        env = compute_df['_env'] if '_env' in cols else None
+        non_preemptible = ~compute_df['preemptible'] if 'preemptible' in cols else None
+        unprotected = ~compute_df['deletion_protection'] if 'deletion_protection' in cols else None
+
         # High-cost storage
-        if 'storage_types' in compute_df.columns:
-            ssd_instances = compute_df[compute_df['storage_types'].str.contains('pd-ssd', na=False)]
-            if len(ssd_instances) > 0:
-                opportunities.append(f"• {len(ssd_instances)} instances using expensive SSD storage")
-        
+        if 'storage_types' in cols:
+            ssd_instances = int(compute_df['storage_types'].str.contains('pd-ssd', na=False, regex=False).sum())
+            if ssd_instances > 0:
+                opportunities.append(f"• {ssd_instances} instances using expensive SSD storage")
+
         # Preemptible opportunities
-        if 'labels' in compute_df.columns and 'preemptible' in compute_df.columns:
-            non_preemptible_dev = compute_df[
-                (compute_df['labels'].str.contains('development', na=False)) & 
-                (compute_df['preemptible'] == 'False')
-            ]
-            if len(non_preemptible_dev) > 0:
-                opportunities.append(f"• {len(non_preemptible_dev)} development instances could be preemptible")
-        
+        if env is not None and non_preemptible is not None:
+            non_preemptible_dev = int((env.eq('development') & non_preemptible).sum())
+            if non_preemptible_dev > 0:
+                opportunities.append(f"• {non_preemptible_dev} development instances could be preemptible")
+
         # Deletion protection
-        if 'labels' in compute_df.columns and 'deletion_protection' in compute_df.columns:
-            unprotected_prod = compute_df[
-                (compute_df['labels'].str.contains('production', na=False)) & 
-                (compute_df['deletion_protection'] == 'False')
-            ]
-            if len(unprotected_prod) > 0:
-                opportunities.append(f"• {len(unprotected_prod)} production instances lack deletion protection")
+        if env is not None and unprotected is not None:
+            unprotected_prod = int((env.eq('production') & unprotected).sum())
+            if unprotected_prod > 0:
+                opportunities.append(f"• {unprotected_prod} production instances lack deletion protection")
     
-    if 'storage' in data:
-        storage_df = data['storage']
-        
+    storage_df = _get_table(data, 'storage')
+    if storage_df is not None:
         # Large buckets
         if 'total_size_gb' in storage_df.columns:
-            large_buckets = storage_df[storage_df['total_size_gb'].astype(str).str.replace('N/A', '0').astype(float) > 1000]
-            if len(large_buckets) > 0:
-                opportunities.append(f"• {len(large_buckets)} buckets over 1TB may benefit from lifecycle policies")
+            large_buckets = int((storage_df['total_size_gb'] > 1000).sum())
+            if large_buckets > 0:
+                opportunities.append(f"• {large_buckets} buckets over 1TB may benefit from lifecycle policies")
     
     if opportunities:
         for opportunity in opportunities:
-            print(opportunity)
+            out.append(opportunity)
     else:
-        print("• No obvious optimization opportunities identified")
+        out.append("• No obvious optimization opportunities identified")
     
-    print()
+    out.append("")
 
-def generate_cost_analysis(data):
+def generate_cost_analysis(data, out):
     """Generate cost analysis insights."""
-    print("COST ANALYSIS INSIGHTS")
-    print("=" * 30)
+    out.append("COST ANALYSIS INSIGHTS")
+    out.append("=" * 30)
     
-    if 'compute' in data:
-        compute_df = data['compute']
-        
+    compute_df = _get_table(data, 'compute')
+    if compute_df is not None:
+        cols = set(compute_df.columns)
+
         # Machine type distribution
-        if 'machine_type' in compute_df.columns:
-            print("Top Machine Types:")
-            machine_types = compute_df['machine_type'].value_counts().head()
-            for machine_type, count in machine_types.items():
-                if machine_type != 'N/A':
-                    print(f"  {machine_type}: {count} instances")
-            print()
+        if 'machine_type' in cols:
+            out.append("Top Machine Types:")
+            machine_types = _value_counts(compute_df, 'machine_type').head()
+            lines = _format_counts(machine_types, "  {}: {} instances")
+            if lines:
+                out.append(lines)
+            out.append("")
         
         # Regional distribution
-        if 'region' in compute_df.columns:
-            print("Regional Distribution:")
-            regions = compute_df['region'].value_counts().head()
-            for region, count in regions.items():
-                if region != 'N/A':
-                    print(f"  {region}: {count} instances")
-            print()
+        if 'region' in cols:
+            out.append("Regional Distribution:")
+            regions = _value_counts(compute_df, 'region').head()
+            lines = _format_counts(regions, "  {}: {} instances")
+            if lines:
+                out.append(lines)
+            out.append("")
     
-    if 'storage' in data:
-        storage_df = data['storage']
-        
+    storage_df = _get_table(data, 'storage')
+    if storage_df is not None:
         # Storage class distribution
         if 'storage_class' in storage_df.columns:
-            print("Storage Class Distribution:")
-            storage_classes = storage_df['storage_class'].value_counts()
-            for storage_class, count in storage_classes.items():
-                if storage_class != 'N/A':
-                    print(f"  {storage_class}: {count} buckets")
-            print()
+            out.append("Storage Class Distribution:")
+            storage_classes = _value_counts(storage_df, 'storage_class')
+            lines = _format_counts(storage_classes, "  {}: {} buckets")
+            if lines:
+                out.append(lines)
+            out.append("")
 
 def main():
     """Main analysis function."""
@@ -243,13 +531,16 @@ def main():
         print("Example: python3 gcp_master_assessment.py --org-id YOUR_ORG_ID")
         return
     
-    # Generate reports
-    generate_executive_summary(data)
-    identify_optimization_opportunities(data)
-    generate_cost_analysis(data)
-    
-    print("Analysis completed!")
-    print("For more detailed analysis, consider using pandas, matplotlib, or other data analysis tools.")
+    # Generate reports into one buffer: a single stdout write instead of
+    # ~60 print calls, each of which locks and may flush on a tty.
+    out = []
+    generate_executive_summary(data, out)
+    identify_optimization_opportunities(data, out)
+    generate_cost_analysis(data, out)
+
+    out.append("Analysis completed!")
+    out.append("For more detailed analysis, consider using pandas, matplotlib, or other data analysis tools.")
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     main()
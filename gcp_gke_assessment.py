@@ -4,11 +4,18 @@ Google Kubernetes Engine (GKE) Assessment Script
 Assesses GKE clusters, node pools, workloads, and resource usage.
 """
 
+import base64
 import csv
+import functools
+import hashlib
 import json
+import operator
+import re
 import subprocess
 import sys
 import os
+import tempfile
+import threading
 import time
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
@@ -16,6 +23,77 @@ import argparse
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
 
+# Optional: with google-api-python-client and google-auth installed (see
+# requirements.txt), cluster listing goes through one Container API call
+# per project instead of gcloud subprocess invocations.
+try:
+    import google.auth
+    import google.auth.transport.requests
+    import google_auth_httplib2
+    import httplib2
+    from googleapiclient import discovery
+except ImportError:
+    discovery = None
+
+# Optional: with the kubernetes package installed, workloads are listed
+# through one in-process API client per cluster (endpoint + CA cert from
+# the cluster payload, bearer token from google-auth) instead of a
+# get-credentials subprocess plus kubectl invocations.
+try:
+    import kubernetes.client
+except ImportError:
+    kubernetes = None
+
+# Optional: ijson parses kubectl output incrementally straight off the
+# pipe, so a multi-MB pod listing is never materialized as one decoded
+# blob — items are mapped to CSV rows and dropped as they stream past.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Errors any of the available parsers may raise on malformed JSON.
+_JSON_ERRORS = (ValueError,) if ijson is None else (ValueError, ijson.common.JSONError)
+
+# Optional: orjson parses and serializes JSON several times faster than
+# the stdlib module, which adds up on multi-MB kubectl/gcloud payloads.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_loads(data):
+    """Parse JSON with the fastest available parser (accepts bytes)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj) -> str:
+    """Serialize to a JSON string with the fastest available serializer."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
+
+def _str_len(value) -> str:
+    return str(len(value))
+
+def _extract(src: Dict, schema) -> Dict:
+    """Build a row dict from (column, path, default, coerce) entries,
+    walking each source path exactly once."""
+    row = {}
+    for column, path, default, coerce in schema:
+        value = src
+        for key in path:
+            if isinstance(value, dict):
+                value = value.get(key)
+            else:
+                value = None
+                break
+        if value is None:
+            value = default
+        row[column] = coerce(value) if coerce is not None else value
+    return row
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -27,48 +105,427 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Width of the per-project inner pool that fans out cluster-level calls,
+# and the rough total-thread budget used to cap outer × inner fan-out.
+INNER_CLUSTER_WORKERS = 8
+TOTAL_THREAD_BUDGET = 64
+
+# Global cap on GKE/Resource Manager requests per second across all
+# worker threads, well under the APIs' default quotas.
+API_RATE_PER_SEC = 20
+
+# (vCPUs, memory GB) for machine types whose specs don't follow the
+# regular <family>-<profile>-<vcpus> naming (shared-core and n1 shapes).
+# Regularly named and custom types are derived in get_machine_type_specs.
+MACHINE_SPECS = {
+    'f1-micro': (1, 0.6),
+    'g1-small': (1, 1.7),
+    'e2-micro': (1, 1),
+    'e2-small': (1, 2),
+    'e2-medium': (1, 4),
+    'n1-standard-1': (1, 3.75),
+    'n1-standard-2': (2, 7.5),
+    'n1-standard-4': (4, 15),
+    'n1-standard-8': (8, 30),
+    'n1-standard-16': (16, 60),
+    'n1-standard-32': (32, 120),
+    'n1-standard-64': (64, 240),
+    'n1-standard-96': (96, 360),
+}
+
+# Regular families encode vCPUs in the name; memory is a fixed GB-per-vCPU
+# ratio per profile (n2/n2d/c2/c3/t2d/e2 standard = 4, highmem = 8, ...).
+_MACHINE_TYPE_RE = re.compile(r'^[a-z][a-z0-9]*-(standard|highmem|highcpu|megamem|ultramem)-(\d+)')
+_GB_PER_VCPU = {
+    'standard': 4.0,
+    'highmem': 8.0,
+    'highcpu': 1.0,
+    'megamem': 14.0,
+    'ultramem': 24.0,
+}
+_N1_GB_PER_VCPU = {'standard': 3.75, 'highmem': 6.5, 'highcpu': 0.9}
+
+# custom-<vcpus>-<memory_mb>, optionally family-prefixed (n2-custom-4-16384).
+_CUSTOM_MACHINE_RE = re.compile(r'^(?:[a-z][a-z0-9]*-)?custom-(\d+)-(\d+)')
+
+# gcloud --format=json(...) projections list only the keys the row
+# builders actually read, which shrinks the JSON moved through the pipe
+# (and parsed) substantially for large listings.
+PROJECT_FORMAT = "json(projectId,name,lifecycleState,projectNumber)"
+CLUSTER_FORMAT = (
+    "json(name,location,locationType,status,currentMasterVersion,"
+    "currentNodeVersion,currentNodeCount,nodeConfig.machineType,"
+    "nodeConfig.diskSizeGb,network,subnetwork,clusterIpv4Cidr,"
+    "servicesIpv4Cidr,autopilot.enabled,privateClusterConfig.enablePrivateNodes,"
+    "masterAuthorizedNetworksConfig.cidrBlocks,networkPolicy.enabled,"
+    "podSecurityPolicyConfig.enabled,workloadIdentityConfig.workloadPool,"
+    "binaryAuthorization.enabled,shieldedNodes.enabled,releaseChannel.channel,"
+    "maintenancePolicy,addonsConfig,resourceLabels,createTime,endpoint,"
+    "masterAuth.clusterCaCertificate,initialClusterVersion,nodePools)"
+)
+
+# Extraction schemas for _extract: output column -> key path into the
+# raw payload, default when absent, optional coercion. Scope/context
+# columns (organization/project/cluster) and computed totals stay with
+# the row builders.
+CLUSTER_SCHEMA = [
+    ('cluster_name', ('name',), 'N/A', None),
+    ('location', ('location',), 'N/A', None),
+    ('location_type', ('locationType',), 'N/A', None),
+    ('status', ('status',), 'N/A', None),
+    ('kubernetes_version', ('currentMasterVersion',), 'N/A', None),
+    ('node_version', ('currentNodeVersion',), 'N/A', None),
+    ('node_count', ('currentNodeCount',), 0, None),
+    ('disk_size_gb', ('nodeConfig', 'diskSizeGb'), 'N/A', str),
+    ('network', ('network',), 'N/A', None),
+    ('subnetwork', ('subnetwork',), 'N/A', None),
+    ('cluster_ipv4_cidr', ('clusterIpv4Cidr',), 'N/A', None),
+    ('services_ipv4_cidr', ('servicesIpv4Cidr',), 'N/A', None),
+    ('autopilot_enabled', ('autopilot', 'enabled'), False, str),
+    ('private_cluster', ('privateClusterConfig', 'enablePrivateNodes'), False, str),
+    ('master_authorized_networks', ('masterAuthorizedNetworksConfig', 'cidrBlocks'), [], _str_len),
+    ('network_policy_enabled', ('networkPolicy', 'enabled'), False, str),
+    ('pod_security_policy_enabled', ('podSecurityPolicyConfig', 'enabled'), False, str),
+    ('workload_identity_enabled', ('workloadIdentityConfig', 'workloadPool'), '',
+     lambda value: str(value != '')),
+    ('binary_authorization_enabled', ('binaryAuthorization', 'enabled'), False, str),
+    ('shielded_nodes_enabled', ('shieldedNodes', 'enabled'), False, str),
+    ('release_channel', ('releaseChannel', 'channel'), 'N/A', None),
+    ('maintenance_window', ('maintenancePolicy',), {}, _json_dumps),
+    ('addons_config', ('addonsConfig',), {}, _json_dumps),
+    ('resource_labels', ('resourceLabels',), {}, _json_dumps),
+    ('creation_time', ('createTime',), 'N/A', None),
+    ('endpoint', ('endpoint',), 'N/A', None),
+    ('initial_cluster_version', ('initialClusterVersion',), 'N/A', None),
+]
+
+POOL_SCHEMA = [
+    ('node_pool_name', ('name',), 'N/A', None),
+    ('status', ('status',), 'N/A', None),
+    ('machine_type', ('config', 'machineType'), 'N/A', None),
+    ('disk_size_gb', ('config', 'diskSizeGb'), 'N/A', str),
+    ('disk_type', ('config', 'diskType'), 'N/A', None),
+    ('image_type', ('config', 'imageType'), 'N/A', None),
+    ('preemptible', ('config', 'preemptible'), False, str),
+    ('spot', ('config', 'spot'), False, str),
+    ('autoscaling_enabled', ('autoscaling', 'enabled'), False, str),
+    ('min_node_count', ('autoscaling', 'minNodeCount'), 'N/A', str),
+    ('max_node_count', ('autoscaling', 'maxNodeCount'), 'N/A', str),
+    ('auto_upgrade', ('management', 'autoUpgrade'), False, str),
+    ('auto_repair', ('management', 'autoRepair'), False, str),
+    ('node_version', ('version',), 'N/A', None),
+    ('locations', ('locations',), [], _json_dumps),
+    ('network_tags', ('config', 'tags'), [], _json_dumps),
+    ('labels', ('config', 'labels'), {}, _json_dumps),
+    ('taints', ('config', 'taints'), [], _json_dumps),
+    ('service_account', ('config', 'serviceAccount'), 'N/A', None),
+    ('oauth_scopes', ('config', 'oauthScopes'), [], _json_dumps),
+]
+
+WORKLOAD_BASE_SCHEMA = [
+    ('resource_name', ('metadata', 'name'), 'N/A', None),
+    ('namespace', ('metadata', 'namespace'), 'N/A', None),
+    ('creation_timestamp', ('metadata', 'creationTimestamp'), 'N/A', None),
+    ('labels', ('metadata', 'labels'), {}, _json_dumps),
+    ('annotations', ('metadata', 'annotations'), {}, _json_dumps),
+]
+
+WORKLOAD_KIND_SCHEMAS = {
+    'deployments': [
+        ('replicas', ('spec', 'replicas'), 0, str),
+        ('ready_replicas', ('status', 'readyReplicas'), 0, str),
+        ('available_replicas', ('status', 'availableReplicas'), 0, str),
+        ('strategy_type', ('spec', 'strategy', 'type'), 'N/A', None),
+    ],
+    'services': [
+        ('service_type', ('spec', 'type'), 'N/A', None),
+        ('cluster_ip', ('spec', 'clusterIP'), 'N/A', None),
+        ('external_ip', ('spec', 'externalIPs'), [], str),
+        ('ports', ('spec', 'ports'), [], _json_dumps),
+    ],
+    'pods': [
+        ('phase', ('status', 'phase'), 'N/A', None),
+        ('node_name', ('spec', 'nodeName'), 'N/A', None),
+        ('restart_policy', ('spec', 'restartPolicy'), 'N/A', None),
+        ('containers_count', ('spec', 'containers'), [], _str_len),
+    ],
+}
+
+# CSV columns for the three output files. Workload rows carry a different
+# key set per resource type (deployment/service/pod), so the workloads list
+# is the union of all of them; missing cells are filled with 'N/A'.
+CLUSTER_FIELDNAMES = [
+    'organization_id', 'project_id', 'project_name', 'cluster_name', 'location',
+    'location_type', 'status', 'kubernetes_version', 'node_version', 'node_count',
+    'machine_type', 'disk_size_gb', 'network', 'subnetwork', 'cluster_ipv4_cidr',
+    'services_ipv4_cidr', 'autopilot_enabled', 'private_cluster',
+    'master_authorized_networks', 'network_policy_enabled', 'pod_security_policy_enabled',
+    'workload_identity_enabled', 'binary_authorization_enabled', 'shielded_nodes_enabled',
+    'release_channel', 'maintenance_window', 'addons_config', 'resource_labels',
+    'creation_time', 'endpoint', 'initial_cluster_version', 'total_vcpus',
+    'total_memory_gb', 'node_pools_count'
+]
+
+POOL_FIELDNAMES = [
+    'organization_id', 'project_id', 'project_name', 'cluster_name', 'cluster_location',
+    'node_pool_name', 'status', 'node_count', 'machine_type', 'disk_size_gb',
+    'disk_type', 'image_type', 'vcpus_per_node', 'memory_gb_per_node',
+    'total_vcpus', 'total_memory_gb', 'preemptible', 'spot', 'autoscaling_enabled',
+    'min_node_count', 'max_node_count', 'auto_upgrade', 'auto_repair',
+    'node_version', 'locations', 'network_tags', 'labels', 'taints',
+    'service_account', 'oauth_scopes'
+]
+
+WORKLOAD_FIELDNAMES = [
+    'organization_id', 'project_id', 'project_name', 'cluster_name', 'cluster_location',
+    'resource_type', 'resource_name', 'namespace', 'creation_timestamp',
+    'labels', 'annotations',
+    # deployments
+    'replicas', 'ready_replicas', 'available_replicas', 'strategy_type',
+    # services
+    'service_type', 'cluster_ip', 'external_ip', 'ports',
+    # pods
+    'phase', 'node_name', 'restart_policy', 'containers_count'
+]
+
+class RateLimiter:
+    """Token-bucket rate limiter shared across worker threads.
+
+    Unlike a fixed per-call sleep, callers only block when the global
+    request rate would exceed ``rate_per_sec``; bursts up to the bucket
+    size pass through immediately.
+    """
+
+    def __init__(self, rate_per_sec: float, burst: Optional[float] = None):
+        self.rate = rate_per_sec
+        self.burst = burst if burst is not None else rate_per_sec
+        self._tokens = self.burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
 class GCPGKEAssessor:
-    def __init__(self, organization_id: Optional[str] = None, folder_id: Optional[str] = None, project_ids: Optional[List[str]] = None):
+    # Project discovery results are cached here between runs; the project
+    # set changes rarely compared to how often assessments are re-run.
+    PROJECT_CACHE_DIR = os.path.expanduser('~/.cache/gcp_gke_assessment')
+
+    def __init__(self, organization_id: Optional[str] = None, folder_id: Optional[str] = None,
+                 project_ids: Optional[List[str]] = None, cache_ttl: int = 3600):
         self.organization_id = organization_id or os.getenv('GCP_ORGANIZATION_ID')
         self.folder_id = folder_id or os.getenv('GCP_FOLDER_ID')
         self.project_ids = project_ids or []
         self.max_workers = 10
-        self.request_delay = 0.1
+        self._rate_limiter = RateLimiter(rate_per_sec=API_RATE_PER_SEC)
+        self.cache_ttl = cache_ttl
+        self._container_service = None
+        self._crm_service = None
+        self._credentials = None
+        self._creds_lock = threading.Lock()
+        self._thread_local = threading.local()
 
     def run_gcloud_command(self, command: List[str], timeout: int = 300) -> Dict[Any, Any]:
-        """Execute gcloud command and return JSON output."""
+        """Execute gcloud command and return JSON output.
+
+        stdout is consumed straight off the pipe as bytes: with ijson
+        installed, top-level JSON arrays (the list commands) are parsed
+        while gcloud is still writing, overlapping download with parse,
+        and the raw bytes never sit in memory next to the parsed tree.
+        """
+        proc = None
+        timed_out = threading.Event()
         try:
             logger.debug(f"Executing: {' '.join(command)}")
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=timeout
-            )
-            
-            if result.stdout.strip():
-                return json.loads(result.stdout)
-            return {}
-            
-        except subprocess.TimeoutExpired:
-            logger.error(f"Command timed out: {' '.join(command)}")
-            return {}
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Command failed: {' '.join(command)}")
-            logger.error(f"Error: {e.stderr}")
-            return {}
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON parsing error: {e}")
+            with self._rate_limiter:
+                proc = subprocess.Popen(command, stdout=subprocess.PIPE,
+                                        stderr=subprocess.PIPE)
+
+            # The deadline is enforced by a watchdog that kills the child:
+            # the streaming reads below block until EOF, so a plain
+            # wait(timeout=...) afterwards would never see a stalled
+            # command. Killing the child unblocks the reads via EOF.
+            def _expire():
+                timed_out.set()
+                proc.kill()
+
+            watchdog = threading.Timer(timeout, _expire)
+            watchdog.start()
+
+            # Drain stderr on a side thread so a chatty command can't fill
+            # that pipe and deadlock while stdout is still being parsed.
+            stderr_chunks = []
+            drain = threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()))
+            drain.start()
+
+            try:
+                if ijson is not None and proc.stdout.peek(1)[:1] == b'[':
+                    data = list(ijson.items(proc.stdout, 'item'))
+                else:
+                    raw = proc.stdout.read()
+                    data = _json_loads(raw) if raw.strip() else {}
+                returncode = proc.wait()
+            finally:
+                watchdog.cancel()
+                # Kill before joining the drain thread: a still-running
+                # child holds its stderr pipe open and the join would
+                # otherwise block on it forever.
+                if proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
+                drain.join()
+                proc.stdout.close()
+                proc.stderr.close()
+
+            if timed_out.is_set():
+                logger.error(f"Command timed out: {' '.join(command)}")
+                return {}
+            if returncode:
+                logger.error(f"Command failed: {' '.join(command)}")
+                logger.error(f"Error: {b''.join(stderr_chunks).decode('utf-8', errors='replace')}")
+                return {}
+            return data
+
+        except _JSON_ERRORS as e:
+            if timed_out.is_set():
+                logger.error(f"Command timed out: {' '.join(command)}")
+            else:
+                logger.error(f"JSON parsing error: {e}")
             return {}
 
+    def _project_cache_path(self) -> str:
+        """Cache filename derived from the assessment scope."""
+        key = f"{self.organization_id}|{self.folder_id}|{','.join(sorted(self.project_ids))}"
+        digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+        return os.path.join(self.PROJECT_CACHE_DIR, f"projects_{digest}.json")
+
     def get_projects(self) -> List[Dict[str, str]]:
-        """Get projects based on specified scope."""
+        """Get projects based on specified scope.
+
+        Discovery costs one gcloud call per project (or per scope), so the
+        result is cached on disk per scope with a TTL. Pass cache_ttl=0
+        (--no-cache on the CLI) to force rediscovery.
+        """
+        cache_path = self._project_cache_path()
+        if self.cache_ttl > 0:
+            try:
+                if time.time() - os.path.getmtime(cache_path) < self.cache_ttl:
+                    with open(cache_path, 'r', encoding='utf-8') as f:
+                        projects = json.load(f)
+                    logger.info(f"Using cached project list ({len(projects)} projects, TTL {self.cache_ttl}s)")
+                    return projects
+            except (OSError, ValueError):
+                pass
+
+        projects = self._discover_projects()
+
+        if self.cache_ttl > 0 and projects:
+            try:
+                os.makedirs(self.PROJECT_CACHE_DIR, exist_ok=True)
+                with open(cache_path, 'w', encoding='utf-8') as f:
+                    json.dump(projects, f)
+            except OSError as e:
+                logger.debug(f"Could not write project cache: {e}")
+
+        return projects
+
+    def _get_crm_service(self):
+        """Build the Cloud Resource Manager discovery client once, or None."""
+        if self._crm_service is None:
+            if discovery is None:
+                self._crm_service = False
+            else:
+                try:
+                    credentials, _ = google.auth.default()
+                    self._crm_service = discovery.build(
+                        'cloudresourcemanager', 'v1',
+                        credentials=credentials,
+                        cache_discovery=False
+                    )
+                except Exception as e:
+                    logger.debug(f"Resource Manager REST client unavailable, using gcloud: {e}")
+                    self._crm_service = False
+        return self._crm_service or None
+
+    def _discover_projects(self) -> List[Dict[str, str]]:
+        """Discover projects for the configured scope.
+
+        Prefers the Resource Manager API — an in-process HTTPS call that
+        returns parsed objects directly — over forking a gcloud subprocess
+        per scope (or per project), which pays interpreter startup plus a
+        JSON round-trip each time.
+        """
+        projects = None
+        service = self._get_crm_service()
+        if service is not None:
+            try:
+                projects = self._discover_projects_rest(service)
+            except Exception as e:
+                logger.warning(f"Resource Manager API listing failed, falling back to gcloud: {e}")
+        if projects is None:
+            projects = self._discover_projects_gcloud()
+
+        logger.info(f"Found {len(projects)} active projects for GKE assessment")
+        return projects
+
+    def _discover_projects_rest(self, service) -> List[Dict[str, str]]:
+        """List projects through the Cloud Resource Manager API."""
+        def row(p):
+            return {
+                'project_id': p['projectId'],
+                'name': p.get('name', p['projectId']),
+                'state': p.get('lifecycleState', 'N/A'),
+                'number': p.get('projectNumber', 'N/A')
+            }
+
         projects = []
-        
         if self.project_ids:
             for project_id in self.project_ids:
-                command = ["gcloud", "projects", "describe", project_id, "--format=json"]
+                p = service.projects().get(projectId=project_id).execute(
+                    http=self._authorized_http())
+                if p.get('lifecycleState') == 'ACTIVE':
+                    projects.append(row(p))
+            return projects
+
+        project_filter = None
+        if self.folder_id:
+            project_filter = f"parent.type=folder parent.id={self.folder_id.replace('folders/', '')}"
+        elif self.organization_id:
+            project_filter = f"parent.type=organization parent.id={self.organization_id}"
+
+        request = service.projects().list(filter=project_filter, pageSize=500)
+        while request is not None:
+            response = request.execute(http=self._authorized_http())
+            projects.extend(
+                row(p) for p in response.get('projects', [])
+                if p.get('lifecycleState') == 'ACTIVE'
+            )
+            request = service.projects().list_next(request, response)
+        return projects
+
+    def _discover_projects_gcloud(self) -> List[Dict[str, str]]:
+        """Discover projects for the configured scope via gcloud."""
+        projects = []
+
+        if self.project_ids:
+            for project_id in self.project_ids:
+                command = ["gcloud", "projects", "describe", project_id, f"--format={PROJECT_FORMAT}"]
                 project_data = self.run_gcloud_command(command)
                 if project_data and project_data.get('lifecycleState') == 'ACTIVE':
                     projects.append({
@@ -81,7 +538,7 @@ class GCPGKEAssessor:
             command = [
                 "gcloud", "projects", "list",
                 f"--filter=parent.id={self.folder_id.replace('folders/', '')}",
-                "--format=json"
+                f"--format={PROJECT_FORMAT}"
             ]
             projects_data = self.run_gcloud_command(command)
             if projects_data:
@@ -99,7 +556,7 @@ class GCPGKEAssessor:
             command = [
                 "gcloud", "projects", "list",
                 f"--filter=parent.id={self.organization_id}",
-                "--format=json"
+                f"--format={PROJECT_FORMAT}"
             ]
             projects_data = self.run_gcloud_command(command)
             if projects_data:
@@ -114,7 +571,7 @@ class GCPGKEAssessor:
                     if project.get('lifecycleState') == 'ACTIVE'
                 ]
         else:
-            command = ["gcloud", "projects", "list", "--format=json"]
+            command = ["gcloud", "projects", "list", f"--format={PROJECT_FORMAT}"]
             projects_data = self.run_gcloud_command(command)
             if projects_data:
                 projects = [
@@ -127,8 +584,7 @@ class GCPGKEAssessor:
                     for project in projects_data
                     if project.get('lifecycleState') == 'ACTIVE'
                 ]
-        
-        logger.info(f"Found {len(projects)} active projects for GKE assessment")
+
         return projects
 
     def assess_project_gke(self, project: Dict[str, str]) -> Dict[str, List]:
@@ -144,86 +600,124 @@ class GCPGKEAssessor:
         
         try:
             # Get GKE clusters
-            gke_data['clusters'] = self.get_gke_clusters(project_id, project)
-            
-            # Get node pools for each cluster
-            for cluster in gke_data['clusters']:
-                cluster_name = cluster['cluster_name']
-                cluster_location = cluster['location']
-                node_pools = self.get_cluster_node_pools(project_id, project, cluster_name, cluster_location)
-                gke_data['node_pools'].extend(node_pools)
-            
-            # Get workloads for each cluster
-            for cluster in gke_data['clusters']:
-                cluster_name = cluster['cluster_name']
-                cluster_location = cluster['location']
-                workloads = self.get_cluster_workloads(project_id, project, cluster_name, cluster_location)
-                gke_data['workloads'].extend(workloads)
-            
+            clusters = self.list_clusters(project_id)
+            gke_data['clusters'], gke_data['node_pools'] = \
+                self.get_gke_clusters_and_pools(project_id, project, clusters)
+
+            # Workload collection per cluster is independent network I/O,
+            # so fan it out on an inner pool instead of walking serially.
+            if clusters:
+                inner_workers = min(INNER_CLUSTER_WORKERS, len(clusters))
+                with ThreadPoolExecutor(max_workers=inner_workers) as executor:
+                    workload_futures = [
+                        executor.submit(self.get_cluster_workloads, project_id, project,
+                                        cluster.get('name', 'N/A'), cluster.get('location', 'N/A'),
+                                        cluster)
+                        for cluster in clusters
+                    ]
+                    for future in workload_futures:
+                        gke_data['workloads'].extend(future.result())
+
         except Exception as e:
             logger.error(f"Error assessing GKE for project {project_id}: {e}")
         
         return gke_data
 
-    def get_gke_clusters(self, project_id: str, project: Dict) -> List[Dict]:
-        """Get GKE clusters for a project."""
+    def _get_container_service(self):
+        """Build the Container API discovery client once, or None.
+
+        Returns None when the optional REST dependencies or application
+        default credentials are unavailable, in which case callers fall
+        back to gcloud subprocesses.
+        """
+        if self._container_service is None:
+            if discovery is None:
+                self._container_service = False
+            else:
+                try:
+                    credentials, _ = google.auth.default()
+                    self._container_service = discovery.build(
+                        'container', 'v1',
+                        credentials=credentials,
+                        cache_discovery=False
+                    )
+                except Exception as e:
+                    logger.debug(f"Container REST client unavailable, using gcloud: {e}")
+                    self._container_service = False
+        return self._container_service or None
+
+    def list_clusters(self, project_id: str) -> List[Dict]:
+        """List all GKE clusters (node pools embedded) for a project.
+
+        The REST path covers every location in a single API call; each
+        cluster arrives with its nodePools[] inline, so no per-cluster
+        subprocess fan-out is needed. The response schema matches gcloud's
+        JSON output, which remains the fallback.
+        """
+        service = self._get_container_service()
+        if service is not None:
+            try:
+                response = service.projects().locations().clusters().list(
+                    parent=f"projects/{project_id}/locations/-"
+                ).execute(http=self._authorized_http())
+                return response.get('clusters', [])
+            except Exception as e:
+                logger.warning(f"Container API list failed for {project_id}, falling back to gcloud: {e}")
+
         command = [
             "gcloud", "container", "clusters", "list",
             f"--project={project_id}",
-            "--format=json"
+            f"--format={CLUSTER_FORMAT}"
         ]
-        
-        clusters = self.run_gcloud_command(command)
+        return self.run_gcloud_command(command) or []
+
+    def get_gke_clusters_and_pools(self, project_id: str, project: Dict,
+                                   clusters: Optional[List[Dict]] = None) -> tuple:
+        """Build cluster and node-pool rows from raw list-clusters payloads.
+
+        The list response carries each cluster's nodePools[] inline with
+        every field the pool rows need, so both CSV row sets (and the
+        cluster resource totals) come out of one pass over the payload
+        with no per-cluster subprocess.
+        """
+        if clusters is None:
+            clusters = self.list_clusters(project_id)
         cluster_data = []
-        
+        pool_data = []
+
         if clusters:
             for cluster in clusters:
-                # Get additional cluster details
                 cluster_name = cluster.get('name', 'N/A')
                 location = cluster.get('location', 'N/A')
-                
-                cluster_details = self.get_cluster_details(project_id, cluster_name, location)
-                
+
+                node_pools = cluster.get('nodePools', [])
+                total_vcpus = 0
+                total_memory_gb = 0
+                for pool in node_pools:
+                    node_count = pool.get('initialNodeCount', 0)
+                    machine_type = pool.get('config', {}).get('machineType', '')
+                    vcpus, memory = self.get_machine_type_specs(machine_type)
+                    total_vcpus += vcpus * node_count
+                    total_memory_gb += memory * node_count
+                    pool_data.append(self._build_node_pool_row(
+                        pool, project_id, project, cluster_name, location))
+
                 cluster_info = {
                     'organization_id': self.organization_id or 'N/A',
                     'project_id': project_id,
                     'project_name': project['name'],
-                    'cluster_name': cluster_name,
-                    'location': location,
-                    'location_type': cluster.get('locationType', 'N/A'),
-                    'status': cluster.get('status', 'N/A'),
-                    'kubernetes_version': cluster.get('currentMasterVersion', 'N/A'),
-                    'node_version': cluster.get('currentNodeVersion', 'N/A'),
-                    'node_count': str(cluster.get('currentNodeCount', 0)),
                     'machine_type': self.get_default_machine_type(cluster),
-                    'disk_size_gb': str(cluster.get('nodeConfig', {}).get('diskSizeGb', 'N/A')),
-                    'network': cluster.get('network', 'N/A'),
-                    'subnetwork': cluster.get('subnetwork', 'N/A'),
-                    'cluster_ipv4_cidr': cluster.get('clusterIpv4Cidr', 'N/A'),
-                    'services_ipv4_cidr': cluster.get('servicesIpv4Cidr', 'N/A'),
-                    'autopilot_enabled': str(cluster.get('autopilot', {}).get('enabled', False)),
-                    'private_cluster': str(cluster.get('privateClusterConfig', {}).get('enablePrivateNodes', False)),
-                    'master_authorized_networks': str(len(cluster.get('masterAuthorizedNetworksConfig', {}).get('cidrBlocks', []))),
-                    'network_policy_enabled': str(cluster.get('networkPolicy', {}).get('enabled', False)),
-                    'pod_security_policy_enabled': str(cluster.get('podSecurityPolicyConfig', {}).get('enabled', False)),
-                    'workload_identity_enabled': str(cluster.get('workloadIdentityConfig', {}).get('workloadPool', '') != ''),
-                    'binary_authorization_enabled': str(cluster.get('binaryAuthorization', {}).get('enabled', False)),
-                    'shielded_nodes_enabled': str(cluster.get('shieldedNodes', {}).get('enabled', False)),
-                    'release_channel': cluster.get('releaseChannel', {}).get('channel', 'N/A'),
-                    'maintenance_window': json.dumps(cluster.get('maintenancePolicy', {})),
-                    'addons_config': json.dumps(cluster.get('addonsConfig', {})),
-                    'resource_labels': json.dumps(cluster.get('resourceLabels', {})),
-                    'creation_time': cluster.get('createTime', 'N/A'),
-                    'endpoint': cluster.get('endpoint', 'N/A'),
-                    'initial_cluster_version': cluster.get('initialClusterVersion', 'N/A')
+                    # Kept numeric so run_assessment can total them without
+                    # round-tripping through str; csv renders them the same.
+                    'total_vcpus': total_vcpus,
+                    'total_memory_gb': total_memory_gb,
+                    'node_pools_count': len(node_pools)
                 }
-                
-                # Add cluster details
-                cluster_info.update(cluster_details)
+                cluster_info.update(_extract(cluster, CLUSTER_SCHEMA))
+
                 cluster_data.append(cluster_info)
-        
-        time.sleep(self.request_delay)
-        return cluster_data
+
+        return cluster_data, pool_data
 
     def get_default_machine_type(self, cluster: Dict) -> str:
         """Extract default machine type from cluster config."""
@@ -232,127 +726,118 @@ class GCPGKEAssessor:
             return node_pools[0].get('config', {}).get('machineType', 'N/A')
         return cluster.get('nodeConfig', {}).get('machineType', 'N/A')
 
-    def get_cluster_details(self, project_id: str, cluster_name: str, location: str) -> Dict:
-        """Get additional cluster details."""
-        command = [
-            "gcloud", "container", "clusters", "describe", cluster_name,
-            f"--location={location}",
-            f"--project={project_id}",
-            "--format=json"
-        ]
-        
-        cluster_details = self.run_gcloud_command(command)
-        
-        details = {
-            'total_vcpus': 'N/A',
-            'total_memory_gb': 'N/A',
-            'node_pools_count': 'N/A'
-        }
-        
-        if cluster_details:
-            # Calculate total resources
-            total_vcpus = 0
-            total_memory_gb = 0
-            node_pools = cluster_details.get('nodePools', [])
-            
-            for pool in node_pools:
-                node_count = pool.get('initialNodeCount', 0)
-                machine_type = pool.get('config', {}).get('machineType', '')
-                
-                # Get machine type specs (simplified)
-                vcpus, memory = self.get_machine_type_specs(machine_type)
-                total_vcpus += vcpus * node_count
-                total_memory_gb += memory * node_count
-            
-            details['total_vcpus'] = str(total_vcpus)
-            details['total_memory_gb'] = str(total_memory_gb)
-            details['node_pools_count'] = str(len(node_pools))
-        
-        return details
-
-    def get_machine_type_specs(self, machine_type: str) -> tuple:
-        """Get vCPUs and memory for a machine type (simplified mapping)."""
-        # Simplified machine type mapping
-        machine_specs = {
-            'e2-micro': (1, 1),
-            'e2-small': (1, 2),
-            'e2-medium': (1, 4),
-            'e2-standard-2': (2, 8),
-            'e2-standard-4': (4, 16),
-            'e2-standard-8': (8, 32),
-            'n1-standard-1': (1, 3.75),
-            'n1-standard-2': (2, 7.5),
-            'n1-standard-4': (4, 15),
-            'n1-standard-8': (8, 30),
-            'n1-standard-16': (16, 60),
-            'n2-standard-2': (2, 8),
-            'n2-standard-4': (4, 16),
-            'n2-standard-8': (8, 32),
-            'n2-standard-16': (16, 64),
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def get_machine_type_specs(machine_type: str) -> tuple:
+        """Get (vCPUs, memory GB) for a machine type.
+
+        Irregular shapes come from the MACHINE_SPECS table; regular
+        <family>-<profile>-<vcpus> and custom-<vcpus>-<mb> names are
+        derived from the name so modern families (n2d, c2, c3, t2d, ...)
+        no longer silently contribute (0, 0) to the totals.
+        """
+        specs = MACHINE_SPECS.get(machine_type)
+        if specs:
+            return specs
+
+        match = _CUSTOM_MACHINE_RE.match(machine_type)
+        if match:
+            return int(match.group(1)), int(match.group(2)) / 1024
+
+        match = _MACHINE_TYPE_RE.match(machine_type)
+        if match:
+            profile, vcpus = match.group(1), int(match.group(2))
+            ratios = _N1_GB_PER_VCPU if machine_type.startswith('n1-') else _GB_PER_VCPU
+            return vcpus, vcpus * ratios[profile]
+
+        if machine_type:
+            logger.debug(f"Unknown machine type {machine_type}; counting as 0 vCPUs/0 GB")
+        return (0, 0)
+
+    def _build_node_pool_row(self, pool: Dict, project_id: str, project: Dict,
+                             cluster_name: str, location: str) -> Dict:
+        """Map one raw node-pool dict to a node-pool CSV row."""
+        vcpus, memory = self.get_machine_type_specs(pool.get('config', {}).get('machineType', ''))
+        node_count = pool.get('initialNodeCount', 0)
+
+        pool_info = {
+            'organization_id': self.organization_id or 'N/A',
+            'project_id': project_id,
+            'project_name': project['name'],
+            'cluster_name': cluster_name,
+            'cluster_location': location,
+            'node_count': str(node_count),
+            'vcpus_per_node': str(vcpus),
+            'memory_gb_per_node': str(memory),
+            'total_vcpus': str(vcpus * node_count),
+            'total_memory_gb': str(memory * node_count)
         }
-        
-        return machine_specs.get(machine_type, (0, 0))
+        pool_info.update(_extract(pool, POOL_SCHEMA))
+        return pool_info
 
-    def get_cluster_node_pools(self, project_id: str, project: Dict, cluster_name: str, location: str) -> List[Dict]:
-        """Get node pools for a specific cluster."""
-        command = [
-            "gcloud", "container", "node-pools", "list",
-            f"--cluster={cluster_name}",
-            f"--location={location}",
-            f"--project={project_id}",
-            "--format=json"
-        ]
-        
-        node_pools = self.run_gcloud_command(command)
-        node_pool_data = []
-        
-        if node_pools:
-            for pool in node_pools:
-                vcpus, memory = self.get_machine_type_specs(pool.get('config', {}).get('machineType', ''))
-                node_count = pool.get('initialNodeCount', 0)
-                
-                pool_info = {
-                    'organization_id': self.organization_id or 'N/A',
-                    'project_id': project_id,
-                    'project_name': project['name'],
-                    'cluster_name': cluster_name,
-                    'cluster_location': location,
-                    'node_pool_name': pool.get('name', 'N/A'),
-                    'status': pool.get('status', 'N/A'),
-                    'node_count': str(node_count),
-                    'machine_type': pool.get('config', {}).get('machineType', 'N/A'),
-                    'disk_size_gb': str(pool.get('config', {}).get('diskSizeGb', 'N/A')),
-                    'disk_type': pool.get('config', {}).get('diskType', 'N/A'),
-                    'image_type': pool.get('config', {}).get('imageType', 'N/A'),
-                    'vcpus_per_node': str(vcpus),
-                    'memory_gb_per_node': str(memory),
-                    'total_vcpus': str(vcpus * node_count),
-                    'total_memory_gb': str(memory * node_count),
-                    'preemptible': str(pool.get('config', {}).get('preemptible', False)),
-                    'spot': str(pool.get('config', {}).get('spot', False)),
-                    'autoscaling_enabled': str(pool.get('autoscaling', {}).get('enabled', False)),
-                    'min_node_count': str(pool.get('autoscaling', {}).get('minNodeCount', 'N/A')),
-                    'max_node_count': str(pool.get('autoscaling', {}).get('maxNodeCount', 'N/A')),
-                    'auto_upgrade': str(pool.get('management', {}).get('autoUpgrade', False)),
-                    'auto_repair': str(pool.get('management', {}).get('autoRepair', False)),
-                    'node_version': pool.get('version', 'N/A'),
-                    'locations': json.dumps(pool.get('locations', [])),
-                    'network_tags': json.dumps(pool.get('config', {}).get('tags', [])),
-                    'labels': json.dumps(pool.get('config', {}).get('labels', {})),
-                    'taints': json.dumps(pool.get('config', {}).get('taints', [])),
-                    'service_account': pool.get('config', {}).get('serviceAccount', 'N/A'),
-                    'oauth_scopes': json.dumps(pool.get('config', {}).get('oauthScopes', []))
-                }
-                
-                node_pool_data.append(pool_info)
-        
-        time.sleep(self.request_delay)
-        return node_pool_data
+    def _get_credentials(self):
+        """Application default credentials, resolved once and shared."""
+        with self._creds_lock:
+            if self._credentials is None:
+                self._credentials, _ = google.auth.default(
+                    scopes=['https://www.googleapis.com/auth/cloud-platform'])
+            return self._credentials
+
+    def _get_access_token(self) -> Optional[str]:
+        """Return a fresh OAuth access token via application default
+        credentials, or None when google-auth is unavailable."""
+        if discovery is None:
+            return None
+        try:
+            credentials = self._get_credentials()
+            with self._creds_lock:
+                if not credentials.valid:
+                    credentials.refresh(google.auth.transport.requests.Request())
+                return credentials.token
+        except Exception as e:
+            logger.debug(f"Could not obtain access token: {e}")
+            return None
 
-    def get_cluster_workloads(self, project_id: str, project: Dict, cluster_name: str, location: str) -> List[Dict]:
+    def _authorized_http(self):
+        """Per-thread AuthorizedHttp wrapping a keep-alive httplib2.Http.
+
+        httplib2 reuses its TLS connection between requests but is not
+        thread-safe, so every REST call runs on its calling thread's own
+        transport (shared credentials) instead of a connection opened —
+        and torn down — per request.
+        """
+        http = getattr(self._thread_local, 'authorized_http', None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(
+                self._get_credentials(), http=httplib2.Http())
+            self._thread_local.authorized_http = http
+        return http
+
+    def get_cluster_workloads(self, project_id: str, project: Dict, cluster_name: str,
+                              location: str, cluster: Optional[Dict] = None) -> List[Dict]:
         """Get workloads (deployments, services, etc.) for a specific cluster."""
+        # Preferred path: talk to the cluster's API server directly with an
+        # in-process client built from the list-clusters payload. One TLS
+        # session serves all three list calls and no kubeconfig is written.
+        if kubernetes is not None and cluster:
+            try:
+                return self._get_workloads_via_api(project_id, project, cluster_name,
+                                                   location, cluster)
+            except Exception as e:
+                logger.debug(f"In-process workload listing failed for {cluster_name}, "
+                             f"falling back to kubectl: {e}")
+
         workload_data = []
-        
+
+        # Clusters are fetched concurrently on the inner pool, and every
+        # get-credentials call rewrites current-context in the shared
+        # kubeconfig — so each cluster gets a private kubeconfig via
+        # KUBECONFIG and kubectl pins the context explicitly instead of
+        # trusting whichever cluster wrote the file last.
+        context = f"gke_{project_id}_{location}_{cluster_name}"
+        kubeconfig = tempfile.NamedTemporaryFile(prefix='gke_kubeconfig_', delete=False)
+        kubeconfig.close()
+        env = dict(os.environ, KUBECONFIG=kubeconfig.name)
         try:
             # Get cluster credentials first
             cred_command = [
@@ -360,199 +845,263 @@ class GCPGKEAssessor:
                 f"--location={location}",
                 f"--project={project_id}"
             ]
-            
-            subprocess.run(cred_command, capture_output=True, check=True)
-            
-            # Get deployments
-            deployments = self.get_kubernetes_resources('deployments', cluster_name, location, project_id, project)
-            workload_data.extend(deployments)
-            
-            # Get services
-            services = self.get_kubernetes_resources('services', cluster_name, location, project_id, project)
-            workload_data.extend(services)
-            
-            # Get pods summary
-            pods = self.get_kubernetes_resources('pods', cluster_name, location, project_id, project)
-            workload_data.extend(pods)
-            
+
+            subprocess.run(cred_command, capture_output=True, check=True, env=env)
+
+            # One kubectl call fetches all three kinds: a single subprocess
+            # spawn, TLS handshake and API-server round trip per cluster.
+            workload_data = self.get_kubernetes_resources(
+                'deployments,services,pods', cluster_name, location, project_id, project,
+                context=context, env=env)
+
         except Exception as e:
             logger.warning(f"Could not get workloads for cluster {cluster_name}: {e}")
-        
+        finally:
+            os.unlink(kubeconfig.name)
+
         return workload_data
 
-    def get_kubernetes_resources(self, resource_type: str, cluster_name: str, location: str, project_id: str, project: Dict) -> List[Dict]:
-        """Get Kubernetes resources using kubectl."""
+    def _get_workloads_via_api(self, project_id: str, project: Dict, cluster_name: str,
+                               location: str, cluster: Dict) -> List[Dict]:
+        """List workloads through a kubernetes.client ApiClient configured
+        from the cluster endpoint, its CA certificate and an ADC token."""
+        token = self._get_access_token()
+        ca_cert_b64 = cluster.get('masterAuth', {}).get('clusterCaCertificate', '')
+        endpoint = cluster.get('endpoint', '')
+        if not (token and ca_cert_b64 and endpoint):
+            raise ValueError("missing endpoint, CA certificate or credentials")
+
+        ca_file = tempfile.NamedTemporaryFile(suffix='.crt', delete=False)
+        try:
+            ca_file.write(base64.b64decode(ca_cert_b64))
+            ca_file.close()
+
+            configuration = kubernetes.client.Configuration()
+            configuration.host = f"https://{endpoint}"
+            configuration.ssl_ca_cert = ca_file.name
+            configuration.api_key['authorization'] = token
+            configuration.api_key_prefix['authorization'] = 'Bearer'
+
+            workload_data = []
+            with kubernetes.client.ApiClient(configuration) as api_client:
+                apps = kubernetes.client.AppsV1Api(api_client)
+                core = kubernetes.client.CoreV1Api(api_client)
+                listings = [
+                    ('deployments', apps.list_deployment_for_all_namespaces),
+                    ('services', core.list_service_for_all_namespaces),
+                    ('pods', core.list_pod_for_all_namespaces),
+                ]
+                for resource_type, list_call in listings:
+                    # sanitize_for_serialization yields the same camelCase
+                    # dicts kubectl emits, so one row builder serves both.
+                    items = api_client.sanitize_for_serialization(list_call().items)
+                    workload_data.extend(self._build_workload_rows(
+                        resource_type, items, cluster_name, location, project_id, project))
+            return workload_data
+        finally:
+            os.unlink(ca_file.name)
+
+    def get_kubernetes_resources(self, resource_type: str, cluster_name: str, location: str,
+                                 project_id: str, project: Dict,
+                                 context: Optional[str] = None,
+                                 env: Optional[Dict[str, str]] = None) -> List[Dict]:
+        """Get Kubernetes resources using kubectl.
+
+        context pins the kubectl invocation to one cluster's kubeconfig
+        entry; env carries the per-cluster KUBECONFIG set by the caller.
+        """
         command = [
             "kubectl", "get", resource_type,
             "--all-namespaces",
             "-o", "json"
         ]
-        
+        if context:
+            command.append(f"--context={context}")
+
+        kinds = resource_type.split(',')
         try:
-            result = subprocess.run(command, capture_output=True, text=True, check=True)
-            k8s_data = json.loads(result.stdout)
-            
+            if ijson is not None:
+                return self._stream_kubernetes_resources(command, kinds, cluster_name,
+                                                         location, project_id, project,
+                                                         env=env)
+
+            result = subprocess.run(command, capture_output=True, check=True, env=env)
+            k8s_data = _json_loads(result.stdout)
+            items = k8s_data.get('items', [])
+            if len(kinds) == 1:
+                return self._build_workload_rows(resource_type, items,
+                                                 cluster_name, location, project_id, project)
+
+            # Mixed listing: group items by their reported kind, then emit
+            # rows in the order the kinds were requested.
+            grouped = {}
+            for item in items:
+                grouped.setdefault(item.get('kind', '').lower() + 's', []).append(item)
             resources = []
-            for item in k8s_data.get('items', []):
-                resource_info = {
-                    'organization_id': self.organization_id or 'N/A',
-                    'project_id': project_id,
-                    'project_name': project['name'],
-                    'cluster_name': cluster_name,
-                    'cluster_location': location,
-                    'resource_type': resource_type.rstrip('s'),  # Remove 's' for singular
-                    'resource_name': item.get('metadata', {}).get('name', 'N/A'),
-                    'namespace': item.get('metadata', {}).get('namespace', 'N/A'),
-                    'creation_timestamp': item.get('metadata', {}).get('creationTimestamp', 'N/A'),
-                    'labels': json.dumps(item.get('metadata', {}).get('labels', {})),
-                    'annotations': json.dumps(item.get('metadata', {}).get('annotations', {}))
-                }
-                
-                # Add resource-specific fields
-                if resource_type == 'deployments':
-                    spec = item.get('spec', {})
-                    status = item.get('status', {})
-                    resource_info.update({
-                        'replicas': str(spec.get('replicas', 0)),
-                        'ready_replicas': str(status.get('readyReplicas', 0)),
-                        'available_replicas': str(status.get('availableReplicas', 0)),
-                        'strategy_type': spec.get('strategy', {}).get('type', 'N/A')
-                    })
-                elif resource_type == 'services':
-                    spec = item.get('spec', {})
-                    resource_info.update({
-                        'service_type': spec.get('type', 'N/A'),
-                        'cluster_ip': spec.get('clusterIP', 'N/A'),
-                        'external_ip': str(spec.get('externalIPs', [])),
-                        'ports': json.dumps(spec.get('ports', []))
-                    })
-                elif resource_type == 'pods':
-                    status = item.get('status', {})
-                    spec = item.get('spec', {})
-                    resource_info.update({
-                        'phase': status.get('phase', 'N/A'),
-                        'node_name': spec.get('nodeName', 'N/A'),
-                        'restart_policy': spec.get('restartPolicy', 'N/A'),
-                        'containers_count': str(len(spec.get('containers', [])))
-                    })
-                
-                resources.append(resource_info)
-            
+            for kind in kinds:
+                resources.extend(self._build_workload_rows(kind, grouped.get(kind, []),
+                                                           cluster_name, location, project_id, project))
             return resources
-            
+
         except Exception as e:
             logger.debug(f"Could not get {resource_type} for cluster {cluster_name}: {e}")
             return []
 
-    def export_gke_data(self, all_gke_data: Dict, base_filename: str):
-        """Export GKE data to separate CSV files."""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        
-        # Export Clusters
-        if all_gke_data['clusters']:
-            clusters_filename = f"{base_filename}_clusters_{timestamp}.csv"
-            cluster_fieldnames = [
-                'organization_id', 'project_id', 'project_name', 'cluster_name', 'location',
-                'location_type', 'status', 'kubernetes_version', 'node_version', 'node_count',
-                'machine_type', 'disk_size_gb', 'network', 'subnetwork', 'cluster_ipv4_cidr',
-                'services_ipv4_cidr', 'autopilot_enabled', 'private_cluster',
-                'master_authorized_networks', 'network_policy_enabled', 'pod_security_policy_enabled',
-                'workload_identity_enabled', 'binary_authorization_enabled', 'shielded_nodes_enabled',
-                'release_channel', 'maintenance_window', 'addons_config', 'resource_labels',
-                'creation_time', 'endpoint', 'initial_cluster_version', 'total_vcpus',
-                'total_memory_gb', 'node_pools_count'
-            ]
-            self.write_csv(all_gke_data['clusters'], clusters_filename, cluster_fieldnames)
-            logger.info(f"Exported {len(all_gke_data['clusters'])} clusters to {clusters_filename}")
-        
-        # Export Node Pools
-        if all_gke_data['node_pools']:
-            pools_filename = f"{base_filename}_node_pools_{timestamp}.csv"
-            pool_fieldnames = [
-                'organization_id', 'project_id', 'project_name', 'cluster_name', 'cluster_location',
-                'node_pool_name', 'status', 'node_count', 'machine_type', 'disk_size_gb',
-                'disk_type', 'image_type', 'vcpus_per_node', 'memory_gb_per_node',
-                'total_vcpus', 'total_memory_gb', 'preemptible', 'spot', 'autoscaling_enabled',
-                'min_node_count', 'max_node_count', 'auto_upgrade', 'auto_repair',
-                'node_version', 'locations', 'network_tags', 'labels', 'taints',
-                'service_account', 'oauth_scopes'
-            ]
-            self.write_csv(all_gke_data['node_pools'], pools_filename, pool_fieldnames)
-            logger.info(f"Exported {len(all_gke_data['node_pools'])} node pools to {pools_filename}")
-        
-        # Export Workloads
-        if all_gke_data['workloads']:
-            workloads_filename = f"{base_filename}_workloads_{timestamp}.csv"
-            # Use flexible fieldnames based on data structure
-            if all_gke_data['workloads']:
-                workload_fieldnames = list(all_gke_data['workloads'][0].keys())
-                self.write_csv(all_gke_data['workloads'], workloads_filename, workload_fieldnames)
-                logger.info(f"Exported {len(all_gke_data['workloads'])} workloads to {workloads_filename}")
-
-    def write_csv(self, data: List[Dict], filename: str, fieldnames: List[str]):
-        """Write data to CSV file."""
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(data)
+    def _stream_kubernetes_resources(self, command: List[str], kinds: List[str], cluster_name: str,
+                                     location: str, project_id: str, project: Dict,
+                                     env: Optional[Dict[str, str]] = None) -> List[Dict]:
+        """Incrementally parse kubectl's JSON from the pipe with ijson,
+        mapping each item to its CSV row as it streams past instead of
+        decoding the whole (potentially tens of MB) document at once."""
+        rows_by_kind = {kind: [] for kind in kinds}
+        proc = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env)
+        try:
+            for item in ijson.items(proc.stdout, 'items.item'):
+                kind = item.get('kind', '').lower() + 's' if len(kinds) > 1 else kinds[0]
+                if kind in rows_by_kind:
+                    rows_by_kind[kind].append(self._build_workload_row(
+                        kind, item, cluster_name, location, project_id, project))
+            _, stderr = proc.communicate()
+            if proc.returncode:
+                raise subprocess.CalledProcessError(proc.returncode, command, stderr=stderr)
+        finally:
+            proc.stdout.close()
+            proc.stderr.close()
+
+        resources = []
+        for kind in kinds:
+            resources.extend(rows_by_kind[kind])
+        return resources
+
+    def _build_workload_rows(self, resource_type: str, items: List[Dict], cluster_name: str,
+                             location: str, project_id: str, project: Dict) -> List[Dict]:
+        """Map raw Kubernetes resource dicts to workload CSV rows."""
+        return [self._build_workload_row(resource_type, item, cluster_name, location,
+                                         project_id, project)
+                for item in items]
+
+    def _build_workload_row(self, resource_type: str, item: Dict, cluster_name: str,
+                            location: str, project_id: str, project: Dict) -> Dict:
+        """Map one raw Kubernetes resource dict to a workload CSV row."""
+        resource_info = {
+            'organization_id': self.organization_id or 'N/A',
+            'project_id': project_id,
+            'project_name': project['name'],
+            'cluster_name': cluster_name,
+            'cluster_location': location,
+            'resource_type': resource_type.rstrip('s')  # Remove 's' for singular
+        }
+        resource_info.update(_extract(item, WORKLOAD_BASE_SCHEMA))
+
+        # Add resource-specific fields
+        kind_schema = WORKLOAD_KIND_SCHEMAS.get(resource_type)
+        if kind_schema:
+            resource_info.update(_extract(item, kind_schema))
+
+        return resource_info
 
     def run_assessment(self, base_filename: str = "gcp_gke", max_workers: int = 10):
-        """Run the complete GKE assessment."""
+        """Run the complete GKE assessment, streaming rows to CSV as
+        each project finishes instead of buffering everything in memory."""
         logger.info("Starting GCP GKE Assessment")
-        
+
         projects = self.get_projects()
         if not projects:
             logger.error("No projects found or accessible")
             return False
-        
-        all_gke_data = {
-            'clusters': [],
-            'node_pools': [],
-            'workloads': []
+
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        output_spec = {
+            'clusters': (f"{base_filename}_clusters_{timestamp}.csv", CLUSTER_FIELDNAMES),
+            'node_pools': (f"{base_filename}_node_pools_{timestamp}.csv", POOL_FIELDNAMES),
+            'workloads': (f"{base_filename}_workloads_{timestamp}.csv", WORKLOAD_FIELDNAMES),
         }
-        
-        # Process projects in parallel
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_project = {
-                executor.submit(self.assess_project_gke, project): project
-                for project in projects
-            }
-            
-            for future in as_completed(future_to_project):
-                project = future_to_project[future]
-                try:
-                    project_gke = future.result()
-                    
-                    # Aggregate data
-                    all_gke_data['clusters'].extend(project_gke['clusters'])
-                    all_gke_data['node_pools'].extend(project_gke['node_pools'])
-                    all_gke_data['workloads'].extend(project_gke['workloads'])
-                    
-                    logger.info(f"Completed GKE assessment for project {project['project_id']}")
-                    
-                except Exception as e:
-                    logger.error(f"Error processing project {project['project_id']}: {e}")
-        
-        # Export results
-        self.export_gke_data(all_gke_data, base_filename)
-        
-        # Calculate totals
-        total_vcpus = sum(int(cluster.get('total_vcpus', 0)) for cluster in all_gke_data['clusters'] if cluster.get('total_vcpus', 'N/A') != 'N/A')
-        total_memory = sum(float(cluster.get('total_memory_gb', 0)) for cluster in all_gke_data['clusters'] if cluster.get('total_memory_gb', 'N/A') != 'N/A')
-        total_nodes = sum(int(cluster.get('node_count', 0)) for cluster in all_gke_data['clusters'])
-        
+        csv_files = {}
+        writers = {}
+        row_counts = {kind: 0 for kind in output_spec}
+        # Rendering rows with a precomputed itemgetter feeding csv.writer
+        # skips DictWriter's per-row-per-column fieldname resolution, which
+        # dominates emission cost on large workload CSVs. Rows missing
+        # fields (workloads carry per-kind subsets) take the .get() path.
+        getters = {kind: operator.itemgetter(*fieldnames)
+                   for kind, (_, fieldnames) in output_spec.items()}
+        fieldsets = {kind: frozenset(fieldnames)
+                     for kind, (_, fieldnames) in output_spec.items()}
+
+        def write_rows(kind, rows):
+            # Files are opened lazily so empty assessments don't leave
+            # header-only CSVs behind, matching the previous behavior.
+            if not rows:
+                return
+            if kind not in writers:
+                filename, fieldnames = output_spec[kind]
+                csv_files[kind] = open(filename, 'w', newline='', encoding='utf-8')
+                writers[kind] = csv.writer(csv_files[kind])
+                writers[kind].writerow(fieldnames)
+            getter, fieldset = getters[kind], fieldsets[kind]
+            fieldnames = output_spec[kind][1]
+            writers[kind].writerows(
+                getter(row) if row.keys() >= fieldset
+                else [row.get(field, 'N/A') for field in fieldnames]
+                for row in rows)
+            row_counts[kind] += len(rows)
+
+        total_vcpus = 0
+        total_memory = 0.0
+        total_nodes = 0
+
+        # Process projects in parallel; cap the outer pool so the combined
+        # outer × inner thread count stays within the overall budget. The
+        # workers spend their time blocked in subprocess waits or HTTP
+        # reads (no GIL contention), so threads overlap the I/O as well as
+        # an event loop would here. Rows are written from this loop only,
+        # so the writers need no locking.
+        project_workers = max(1, min(max_workers, len(projects),
+                                     TOTAL_THREAD_BUDGET // INNER_CLUSTER_WORKERS))
+        try:
+            with ThreadPoolExecutor(max_workers=project_workers) as executor:
+                future_to_project = {
+                    executor.submit(self.assess_project_gke, project): project
+                    for project in projects
+                }
+
+                for future in as_completed(future_to_project):
+                    project = future_to_project[future]
+                    try:
+                        project_gke = future.result()
+
+                        for cluster in project_gke['clusters']:
+                            total_vcpus += cluster['total_vcpus']
+                            total_memory += cluster['total_memory_gb']
+                            total_nodes += cluster['node_count']
+
+                        for kind in output_spec:
+                            write_rows(kind, project_gke[kind])
+
+                        logger.info(f"Completed GKE assessment for project {project['project_id']}")
+
+                    except Exception as e:
+                        logger.error(f"Error processing project {project['project_id']}: {e}")
+        finally:
+            for csvfile in csv_files.values():
+                csvfile.close()
+
+        for kind, (filename, _) in output_spec.items():
+            if row_counts[kind]:
+                logger.info(f"Exported {row_counts[kind]} {kind.replace('_', ' ')} to {filename}")
+
         # Summary
         logger.info("="*60)
         logger.info("GKE ASSESSMENT COMPLETED")
         logger.info(f"Projects processed: {len(projects)}")
-        logger.info(f"Total clusters found: {len(all_gke_data['clusters'])}")
-        logger.info(f"Total node pools found: {len(all_gke_data['node_pools'])}")
-        logger.info(f"Total workloads found: {len(all_gke_data['workloads'])}")
+        logger.info(f"Total clusters found: {row_counts['clusters']}")
+        logger.info(f"Total node pools found: {row_counts['node_pools']}")
+        logger.info(f"Total workloads found: {row_counts['workloads']}")
         logger.info(f"Total nodes: {total_nodes}")
         logger.info(f"Total vCPUs: {total_vcpus}")
         logger.info(f"Total memory: {total_memory:.2f} GB")
         logger.info("="*60)
-        
+
         return True
 
 def main():
@@ -565,6 +1114,10 @@ def main():
     
     parser.add_argument('--output-prefix', default='gcp_gke', help='Output file prefix')
     parser.add_argument('--max-workers', type=int, default=10, help='Maximum parallel workers')
+    parser.add_argument('--cache-ttl', type=int, default=3600,
+                       help='Seconds to reuse the cached project list (default: 3600)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Ignore and refresh the cached project list')
     parser.add_argument('--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], 
                        default='INFO', help='Logging level')
     
@@ -579,7 +1132,8 @@ def main():
     assessor = GCPGKEAssessor(
         organization_id=args.org_id,
         folder_id=args.folder_id,
-        project_ids=project_ids
+        project_ids=project_ids,
+        cache_ttl=0 if args.no_cache else args.cache_ttl
     )
     
     success = assessor.run_assessment(
@@ -4,26 +4,115 @@ GCP Master Assessment Script
 Runs all GCP service assessments (Compute, Networking, Storage, GKE) in sequence or parallel.
 """
 
+import atexit
+import collections
+import importlib
+import multiprocessing
+import re
+import selectors
+import shutil
 import subprocess
 import sys
 import os
 import time
 import argparse
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import (FIRST_COMPLETED, ProcessPoolExecutor,
+                                TimeoutError as FuturesTimeout, wait)
 import logging
+from logging.handlers import QueueHandler, QueueListener
 
-# Configure logging
+# Configure logging. Records are pushed onto a queue and drained to disk and
+# stdout by a single listener thread, so worker threads and processes never
+# contend on the file handler's lock; a multiprocessing queue lets records
+# from forked pool workers reach the same listener.
+_log_queue = multiprocessing.Queue(-1)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('gcp_master_assessment.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=[QueueHandler(_log_queue)]
 )
+_log_listener = QueueListener(
+    _log_queue,
+    logging.FileHandler('gcp_master_assessment.log'),
+    logging.StreamHandler(sys.stdout)
+)
+_log_listener.start()
 logger = logging.getLogger(__name__)
 
+# atexit handlers are inherited by forked pool workers; guard them so a
+# worker exiting does not stop the parent's listener or pool.
+_main_pid = os.getpid()
+
+
+def _stop_log_listener():
+    if os.getpid() == _main_pid:
+        _log_listener.stop()
+
+
+atexit.register(_stop_log_listener)
+
+# Errors that will hit every service alike (broken credentials, exhausted
+# quota); once one assessment fails this way there is no point waiting out
+# the rest.
+_FATAL_ERROR_RE = re.compile(
+    r'permission denied|not authorized|unauthenticated|invalid.{0,10}credentials'
+    r'|quota exceeded|rate.?limit exceeded',
+    re.IGNORECASE
+)
+
+# Command-construction tables: the first matching scope attribute wins, and
+# each service contributes its fixed output flags ({timestamp} is filled in
+# with the run timestamp).
+SCOPE_FLAGS = (
+    ('org_id', '--org-id'),
+    ('folder_id', '--folder-id'),
+    ('project_ids', '--project-ids'),
+)
+
+SERVICE_OUTPUTS = {
+    'compute': (
+        ('--inventory-file', 'gcp_compute_inventory_{timestamp}.csv'),
+        ('--utilization-file', 'gcp_compute_utilization_{timestamp}.csv'),
+    ),
+    'networking': (('--output-prefix', 'gcp_networking'),),
+    'storage': (('--output-prefix', 'gcp_storage'),),
+    'gke': (('--output-prefix', 'gcp_gke'),),
+}
+
+# Persistent worker pool shared by all GCPMasterAssessor instances. The
+# assessments are CPU-heavy Python (API parsing, CSV writing), so separate
+# processes sidestep GIL contention that the in-process path would otherwise
+# introduce; keeping the pool alive avoids re-paying worker startup when the
+# suite is run repeatedly (e.g. from a scheduler).
+_process_pool = None
+
+
+def _get_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Return the shared ProcessPoolExecutor, creating it on first use."""
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=max_workers)
+    return _process_pool
+
+
+def _shutdown_process_pool():
+    """Shut down the shared worker pool; it is recreated lazily if needed."""
+    global _process_pool
+    if _process_pool is not None and os.getpid() == _main_pid:
+        _process_pool.shutdown()
+        _process_pool = None
+
+
+atexit.register(_shutdown_process_pool)
+
+
+def _run_service_entrypoint(service: str, args_dict: dict, output_suffix: str = '') -> dict:
+    """Top-level (picklable) entry point executed in a worker process."""
+    args = argparse.Namespace(**args_dict)
+    return GCPMasterAssessor().run_single_assessment(service, args, output_suffix)
+
+
 class GCPMasterAssessor:
     def __init__(self):
         self.script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -33,184 +122,654 @@ class GCPMasterAssessor:
             'storage': 'gcp_storage_assessment.py',
             'gke': 'gcp_gke_assessment.py'
         }
-        
-    def run_single_assessment(self, service: str, args: argparse.Namespace) -> dict:
-        """Run a single service assessment."""
-        script_name = self.assessment_scripts[service]
-        script_path = os.path.join(self.script_dir, script_name)
-        
-        if not os.path.exists(script_path):
-            logger.error(f"Assessment script not found: {script_path}")
-            return {'service': service, 'success': False, 'error': 'Script not found'}
-        
-        # Build command
-        command = ['python3', script_path]
-        
-        # Add scope arguments
-        if args.org_id:
-            command.extend(['--org-id', args.org_id])
-        elif args.folder_id:
-            command.extend(['--folder-id', args.folder_id])
-        elif args.project_ids:
-            command.extend(['--project-ids', args.project_ids])
-        
-        # Add service-specific arguments
-        if service == 'compute':
-            command.extend([
-                '--inventory-file', f'gcp_compute_inventory_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv',
-                '--utilization-file', f'gcp_compute_utilization_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
-            ])
-        else:
-            command.extend(['--output-prefix', f'gcp_{service}'])
-        
-        # Add common arguments
-        command.extend(['--max-workers', str(args.max_workers)])
-        command.extend(['--log-level', args.log_level])
-        
-        logger.info(f"Starting {service.upper()} assessment...")
+        self.assessment_modules = {
+            'compute': ('gcp_org_compute_inventory', 'GCPComputeAssessor'),
+            'networking': ('gcp_networking_assessment', 'GCPNetworkingAssessor'),
+            'storage': ('gcp_storage_assessment', 'GCPStorageAssessor'),
+            'gke': ('gcp_gke_assessment', 'GCPGKEAssessor')
+        }
+        # Resolve script locations once; the subprocess fallback then checks
+        # set membership instead of stat-ing the filesystem per call.
+        self.script_paths = {
+            service: os.path.join(self.script_dir, script_name)
+            for service, script_name in self.assessment_scripts.items()
+        }
+        self.missing_scripts = {
+            service for service, path in self.script_paths.items()
+            if not os.path.exists(path)
+        }
+        # Bounded stderr tails for subprocess fallbacks, keyed by service.
+        self._stderr_tails = {}
+        # CLI scope flags, resolved once per run by _get_scope_args.
+        self._scope_args = None
+        # One timestamp per run so the inventory and utilization filenames
+        # (and every service launched from this assessor) agree; the human
+        # form is reused by the summary report.
+        run_started = datetime.now()
+        self.run_timestamp = run_started.strftime("%Y%m%d_%H%M%S")
+        self.run_ts_human = run_started.strftime('%Y-%m-%d %H:%M:%S UTC')
+        # Fixed command prefix per service (interpreter, script and output
+        # flags); _build_command clones it and appends the run-scoped flags.
+        self._command_templates = {}
+        for service, script_path in self.script_paths.items():
+            template = ['python3', script_path]
+            for flag, value in SERVICE_OUTPUTS[service]:
+                template.extend([flag, value.format(timestamp=self.run_timestamp)])
+            self._command_templates[service] = template
+        # Common CLI flags, resolved once per run by _build_command.
+        self._common_args = None
+
+    def close(self):
+        """Release the shared worker pool. Safe to call more than once."""
+        _shutdown_process_pool()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _load_assessor_class(self, service: str):
+        """Import the service's assessment module and return its assessor class.
+
+        Returns None when the module or class is unavailable, in which case
+        the caller falls back to launching the script as a subprocess.
+        """
+        module_name, class_name = self.assessment_modules[service]
+        try:
+            module = importlib.import_module(module_name)
+            return getattr(module, class_name)
+        except (ImportError, AttributeError) as e:
+            logger.debug("Cannot import %s.%s (%s), falling back to subprocess", module_name, class_name, e)
+            return None
+
+    def run_single_assessment(self, service: str, args: argparse.Namespace,
+                              output_suffix: str = '') -> dict:
+        """Run a single service assessment in-process.
+
+        Imports the service's module once and drives its assessor directly,
+        avoiding a fresh python3 interpreter (and full client-library
+        re-import) per service. Falls back to the subprocess path when the
+        module cannot be imported.
+
+        output_suffix is appended to the output file prefix; sharded runs use
+        it to keep each shard's CSVs apart until they are merged.
+        """
+        assessor_class = self._load_assessor_class(service)
+        if assessor_class is None:
+            return self._run_subprocess_assessment(service, args)
+
+        project_ids = None
+        if args.project_ids:
+            project_ids = [pid.strip() for pid in args.project_ids.split(',')]
+
+        logger.info("Starting %s assessment...", service.upper())
         start_time = time.time()
-        
+
         try:
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=args.timeout
+            assessor = assessor_class(
+                organization_id=args.org_id,
+                folder_id=args.folder_id,
+                project_ids=project_ids
             )
-            
-            end_time = time.time()
-            duration = end_time - start_time
-            
-            logger.info(f"{service.upper()} assessment completed successfully in {duration:.2f} seconds")
-            
+
+            if service == 'compute':
+                success = assessor.run_assessment(
+                    inventory_file=f'gcp_compute_inventory{output_suffix}_{self.run_timestamp}.csv',
+                    utilization_file=f'gcp_compute_utilization{output_suffix}_{self.run_timestamp}.csv',
+                    max_workers=args.max_workers
+                )
+            else:
+                success = assessor.run_assessment(
+                    base_filename=f'gcp_{service}{output_suffix}',
+                    max_workers=args.max_workers
+                )
+
+            duration = time.time() - start_time
+
+            if success:
+                logger.info("%s assessment completed successfully in %.2f seconds", service.upper(), duration)
+                return {
+                    'service': service,
+                    'success': True,
+                    'duration': duration
+                }
+
+            logger.error("%s assessment reported failure after %.2f seconds", service.upper(), duration)
             return {
                 'service': service,
-                'success': True,
+                'success': False,
                 'duration': duration,
-                'stdout': result.stdout,
-                'stderr': result.stderr
+                'error': 'Assessment reported failure'
             }
-            
-        except subprocess.TimeoutExpired:
-            logger.error(f"{service.upper()} assessment timed out after {args.timeout} seconds")
+
+        except Exception as e:
+            logger.error("Unexpected error running %s assessment: %s", service.upper(), e)
             return {
                 'service': service,
                 'success': False,
-                'error': f'Timeout after {args.timeout} seconds'
+                'error': str(e)
             }
-        except subprocess.CalledProcessError as e:
-            logger.error(f"{service.upper()} assessment failed with exit code {e.returncode}")
-            logger.error(f"Error output: {e.stderr}")
+
+    def _get_scope_args(self, args: argparse.Namespace) -> list:
+        """Return the CLI scope flags, resolving them once per run.
+
+        Every service of a run shares the same scope, so the org/folder/
+        project branching happens on the first call only.
+        """
+        if self._scope_args is None:
+            for attr, flag in SCOPE_FLAGS:
+                value = getattr(args, attr, None)
+                if value:
+                    self._scope_args = [flag, value]
+                    break
+            else:
+                self._scope_args = []
+        return self._scope_args
+
+    def _build_command(self, service: str, args: argparse.Namespace) -> list:
+        """Build the CLI command for running a service's script as a subprocess."""
+        if self._common_args is None:
+            self._common_args = [
+                '--max-workers', str(args.max_workers),
+                '--log-level', args.log_level
+            ]
+
+        command = self._command_templates[service].copy()
+        command += self._get_scope_args(args)
+        command += self._common_args
+        return command
+
+    def _run_subprocess_assessment(self, service: str, args: argparse.Namespace) -> dict:
+        """Run a single service assessment as a subprocess."""
+        if service in self.missing_scripts:
+            logger.error("Assessment script not found: %s", self.script_paths[service])
+            return {'service': service, 'success': False, 'error': 'Script not found'}
+
+        logger.info("Starting %s assessment...", service.upper())
+        start_time = time.time()
+
+        try:
+            proc = subprocess.Popen(
+                self._build_command(service, args),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True
+            )
+            returncode = self._supervise_subprocesses({service: proc}, args.timeout)[service]
+            return self._subprocess_result(service, returncode, time.time() - start_time, args.timeout)
+
+        except Exception as e:
+            logger.error("Unexpected error running %s assessment: %s", service.upper(), e)
             return {
                 'service': service,
                 'success': False,
-                'error': f'Exit code {e.returncode}: {e.stderr}'
+                'error': str(e)
             }
-        except Exception as e:
-            logger.error(f"Unexpected error running {service.upper()} assessment: {e}")
+
+    def _run_parallel_subprocesses(self, services: list, args: argparse.Namespace) -> dict:
+        """Run several subprocess-fallback services under one supervisor.
+
+        All children are launched upfront with Popen and supervised by a
+        single selectors loop — no pool worker blocked per child.
+        """
+        results = {}
+        procs = {}
+        start_times = {}
+
+        for service in services:
+            if service in self.missing_scripts:
+                logger.error("Assessment script not found: %s", self.script_paths[service])
+                results[service] = {'service': service, 'success': False, 'error': 'Script not found'}
+                continue
+
+            logger.info("Starting %s assessment...", service.upper())
+            start_times[service] = time.time()
+            try:
+                procs[service] = subprocess.Popen(
+                    self._build_command(service, args),
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True
+                )
+            except Exception as e:
+                logger.error("Unexpected error running %s assessment: %s", service.upper(), e)
+                results[service] = {'service': service, 'success': False, 'error': str(e)}
+
+        if procs:
+            returncodes = self._supervise_subprocesses(procs, args.timeout)
+            for service, returncode in returncodes.items():
+                duration = time.time() - start_times[service]
+                results[service] = self._subprocess_result(service, returncode, duration, args.timeout)
+
+        return results
+
+    def _supervise_subprocesses(self, procs: dict, timeout: int) -> dict:
+        """Supervise one or more children with a single selectors loop.
+
+        Instead of buffering each child's output in memory (capture_output
+        holds everything until exit) or dedicating a thread per child, every
+        pipe is registered with one selector and each line is appended to
+        per-service log files ({service}.out / {service}.err) as it arrives.
+        Only a short tail of stderr is retained in memory for error
+        reporting.
+
+        The poll interval is adaptive: it starts at 0.25 s and doubles to a
+        5 s cap while the children are quiet, resetting on any output, so
+        short assessments complete with sub-second latency while hour-long
+        ones do not busy-wake the supervising thread.
+
+        Returns {service: exit code}; a child that outlives the timeout is
+        killed and recorded with exit code None.
+        """
+        deadline = time.time() + timeout
+        poll_interval = 0.25
+        max_poll_interval = 5.0
+
+        sel = selectors.DefaultSelector()
+        log_files = []
+        open_streams = 0
+        returncodes = {}
+
+        for service, proc in procs.items():
+            stderr_tail = collections.deque(maxlen=20)
+            self._stderr_tails[service] = stderr_tail
+
+            out_file = open(f'{service}.out', 'w')
+            err_file = open(f'{service}.err', 'w')
+            log_files.extend([out_file, err_file])
+            logger.debug("%s output redirected to %s.out / %s.err", service, service, service)
+
+            sel.register(proc.stdout, selectors.EVENT_READ, (out_file, None))
+            sel.register(proc.stderr, selectors.EVENT_READ, (err_file, stderr_tail))
+            open_streams += 2
+
+        try:
+            while open_streams:
+                if time.time() > deadline:
+                    for service, proc in procs.items():
+                        returncode = proc.poll()
+                        if returncode is None:
+                            proc.kill()
+                            proc.wait()
+                        returncodes[service] = returncode
+                    return returncodes
+
+                events = sel.select(timeout=poll_interval)
+                if events:
+                    poll_interval = 0.25
+                else:
+                    poll_interval = min(poll_interval * 2, max_poll_interval)
+                for key, _ in events:
+                    line = key.fileobj.readline()
+                    if not line:
+                        sel.unregister(key.fileobj)
+                        open_streams -= 1
+                        continue
+                    sink, tail = key.data
+                    if tail is not None:
+                        tail.append(line)
+                    sink.write(line)
+
+            for service, proc in procs.items():
+                try:
+                    returncodes[service] = proc.wait(timeout=max(1, deadline - time.time()))
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.wait()
+                    returncodes[service] = None
+
+            return returncodes
+        finally:
+            sel.close()
+            for proc in procs.values():
+                proc.stdout.close()
+                proc.stderr.close()
+            for log_file in log_files:
+                log_file.close()
+
+    def _subprocess_result(self, service: str, returncode, duration: float, timeout: int) -> dict:
+        """Translate a supervised child's exit code into a result dict."""
+        if returncode is None:
+            self._stderr_tails.pop(service, None)
+            logger.error("%s assessment timed out after %s seconds", service.upper(), timeout)
             return {
                 'service': service,
                 'success': False,
-                'error': str(e)
+                'error': f'Timeout after {timeout} seconds'
             }
 
+        if returncode != 0:
+            stderr_tail = ''.join(self._stderr_tails.pop(service, []))
+            logger.error("%s assessment failed with exit code %s", service.upper(), returncode)
+            logger.error("Error output: %s", stderr_tail)
+            return {
+                'service': service,
+                'success': False,
+                'error': f'Exit code {returncode}: {stderr_tail}'
+            }
+
+        self._stderr_tails.pop(service, None)
+        logger.info("%s assessment completed successfully in %.2f seconds", service.upper(), duration)
+        return {
+            'service': service,
+            'success': True,
+            'duration': duration
+        }
+
     def run_sequential_assessment(self, services: list, args: argparse.Namespace) -> dict:
-        """Run assessments sequentially."""
+        """Run assessments sequentially.
+
+        In-process services are still driven one at a time, but through the
+        shared worker pool so the --timeout deadline can be enforced from
+        here; a run on the calling thread could not be interrupted. The
+        worker is reused across services, keeping the single-import win.
+        """
         results = {}
         total_start_time = time.time()
-        
+
+        executor = _get_process_pool(max_workers=max(4, len(self.assessment_scripts)))
+
         for service in services:
-            result = self.run_single_assessment(service, args)
+            if self._load_assessor_class(service) is None:
+                # Subprocess fallback: _supervise_subprocesses applies the
+                # timeout itself.
+                result = self.run_single_assessment(service, args)
+            else:
+                future = executor.submit(_run_service_entrypoint, service, vars(args))
+                try:
+                    result = future.result(timeout=args.timeout)
+                except FuturesTimeout:
+                    future.cancel()
+                    result = self._subprocess_result(service, None, args.timeout, args.timeout)
+                except Exception as e:
+                    logger.error("Error in %s assessment: %s", service.upper(), e)
+                    result = {
+                        'service': service,
+                        'success': False,
+                        'error': str(e)
+                    }
             results[service] = result
-            
+
             if not result['success']:
-                logger.warning(f"{service.upper()} assessment failed, continuing with next service...")
+                logger.warning("%s assessment failed, continuing with next service...", service.upper())
         
         total_duration = time.time() - total_start_time
         results['total_duration'] = total_duration
         
         return results
 
+    def _resolve_project_ids(self, args: argparse.Namespace) -> list:
+        """Resolve the run's scope to a flat list of active project IDs."""
+        if args.project_ids:
+            return [pid.strip() for pid in args.project_ids.split(',')]
+
+        command = ['gcloud', 'projects', 'list', '--format=value(projectId)']
+        if args.org_id:
+            command.append(f'--filter=parent.id={args.org_id} AND lifecycleState:ACTIVE')
+        elif args.folder_id:
+            folder_id = args.folder_id.replace('folders/', '')
+            command.append(f'--filter=parent.id={folder_id} AND lifecycleState:ACTIVE')
+        else:
+            command.append('--filter=lifecycleState:ACTIVE')
+
+        try:
+            result = subprocess.run(command, capture_output=True, text=True, check=True, timeout=300)
+        except Exception as e:
+            logger.warning("Could not resolve project list for sharding: %s", e)
+            return []
+        return [line.strip() for line in result.stdout.splitlines() if line.strip()]
+
+    def _merge_sharded_outputs(self, service: str):
+        """Concatenate a service's per-shard CSVs into one file per output.
+
+        Shard files differ only by their _shardNN token (and possibly the
+        second the child stamped them with); they are grouped by the
+        normalized name, concatenated with a single header and removed.
+        """
+        shard_re = re.compile(r'_shard\d+')
+        timestamp_re = re.compile(r'\d{8}_\d{6}')
+        prefix = 'gcp_compute' if service == 'compute' else f'gcp_{service}'
+
+        groups = {}
+        for filename in sorted(os.listdir('.')):
+            if filename.startswith(prefix) and '_shard' in filename and filename.endswith('.csv'):
+                merged_name = timestamp_re.sub(self.run_timestamp, shard_re.sub('', filename))
+                groups.setdefault(merged_name, []).append(filename)
+
+        for merged_name, shard_files in groups.items():
+            with open(merged_name, 'w') as merged:
+                for index, shard_file in enumerate(shard_files):
+                    with open(shard_file) as f:
+                        if index:
+                            f.readline()  # skip the duplicate header
+                        shutil.copyfileobj(f, merged)
+                    os.remove(shard_file)
+            logger.info("Merged %d shard files into %s", len(shard_files), merged_name)
+
+    def _run_sharded_parallel_assessment(self, services: list, args: argparse.Namespace):
+        """Run each service against project shards for service x shard concurrency.
+
+        The per-service model caps parallelism at the service count; for a
+        large org, splitting the project list into max_workers shards and
+        submitting (service, shard) pairs multiplies throughput on these
+        I/O-bound scans. Returns None when sharding is not applicable so the
+        caller can fall back to per-service parallelism.
+        """
+        project_ids = self._resolve_project_ids(args)
+        if len(project_ids) < 2:
+            logger.info("Sharding skipped: %d project(s) resolved", len(project_ids))
+            return None
+
+        shard_count = min(args.max_workers, len(project_ids))
+        shards = [project_ids[i::shard_count] for i in range(shard_count)]
+        logger.info("Sharding %d projects across %d shards per service",
+                    len(project_ids), shard_count)
+
+        results = {}
+        total_start_time = time.time()
+
+        in_process = [s for s in services if self._load_assessor_class(s) is not None]
+        fallback = [s for s in services if s not in in_process]
+
+        executor = _get_process_pool(max_workers=shard_count * max(1, len(in_process)))
+
+        future_to_task = {}
+        for service in in_process:
+            for shard_index, shard in enumerate(shards):
+                # Keep the original org/folder id: every assessor scopes
+                # discovery by project_ids when set, so no re-enumeration
+                # happens, and the organization_id CSV cell still matches
+                # what a non-sharded run would write.
+                shard_args = vars(args).copy()
+                shard_args.update(project_ids=','.join(shard))
+                future = executor.submit(
+                    _run_service_entrypoint, service, shard_args,
+                    f'_shard{shard_index + 1:02d}'
+                )
+                future_to_task[future] = (service, shard_index)
+
+        # Services without an importable module cannot shard their output
+        # naming; run them once over the full scope as subprocesses.
+        if fallback:
+            results.update(self._run_parallel_subprocesses(fallback, args))
+
+        # Shards run concurrently, so one deadline from the start of the
+        # run bounds every (service, shard) future.
+        deadline = total_start_time + args.timeout
+        shard_results = {service: [] for service in in_process}
+        for future in future_to_task:
+            service, shard_index = future_to_task[future]
+            try:
+                shard_results[service].append(
+                    future.result(timeout=max(0, deadline - time.time())))
+            except FuturesTimeout:
+                future.cancel()
+                logger.error("%s assessment (shard %d) timed out after %s seconds",
+                             service.upper(), shard_index + 1, args.timeout)
+                shard_results[service].append(
+                    {'service': service, 'success': False,
+                     'error': f'Timeout after {args.timeout} seconds'}
+                )
+            except Exception as e:
+                logger.error("Error in %s assessment (shard %d): %s",
+                             service.upper(), shard_index + 1, e)
+                shard_results[service].append(
+                    {'service': service, 'success': False, 'error': str(e)}
+                )
+
+        for service in in_process:
+            outcomes = shard_results[service]
+            errors = [r['error'] for r in outcomes if not r.get('success')]
+            results[service] = {
+                'service': service,
+                'success': not errors,
+                'duration': max((r.get('duration', 0) for r in outcomes), default=0),
+            }
+            if errors:
+                results[service]['error'] = '; '.join(errors)
+            self._merge_sharded_outputs(service)
+
+        results['total_duration'] = time.time() - total_start_time
+        return results
+
     def run_parallel_assessment(self, services: list, args: argparse.Namespace) -> dict:
         """Run assessments in parallel."""
+        if getattr(args, 'shard_projects', False):
+            sharded = self._run_sharded_parallel_assessment(services, args)
+            if sharded is not None:
+                return sharded
+
         results = {}
         total_start_time = time.time()
-        
-        with ThreadPoolExecutor(max_workers=len(services)) as executor:
-            # Submit all assessment tasks
-            future_to_service = {
-                executor.submit(self.run_single_assessment, service, args): service
-                for service in services
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_service):
+
+        # Services whose modules import go to the worker pool; the rest fall
+        # back to subprocesses, all supervised by one selectors loop here
+        # rather than occupying a pool worker each just to babysit a pipe.
+        in_process = [s for s in services if self._load_assessor_class(s) is not None]
+        fallback = [s for s in services if s not in in_process]
+
+        executor = _get_process_pool(max_workers=max(4, len(self.assessment_scripts)))
+
+        # Submit all assessment tasks
+        future_to_service = {
+            executor.submit(_run_service_entrypoint, service, vars(args)): service
+            for service in in_process
+        }
+
+        if fallback:
+            results.update(self._run_parallel_subprocesses(fallback, args))
+
+        # Collect results as they complete, bailing out early when a failure
+        # is one that would hit every remaining service anyway. The services
+        # run concurrently, so one deadline from the start of the run
+        # enforces the per-assessment --timeout for all of them.
+        deadline = total_start_time + args.timeout
+        pending = set(future_to_service)
+        while pending:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                for future in pending:
+                    future.cancel()
+                    timed_out = future_to_service[future]
+                    results[timed_out] = self._subprocess_result(
+                        timed_out, None, args.timeout, args.timeout)
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
                 service = future_to_service[future]
                 try:
                     result = future.result()
                     results[service] = result
                 except Exception as e:
-                    logger.error(f"Error in {service.upper()} assessment: {e}")
-                    results[service] = {
+                    logger.error("Error in %s assessment: %s", service.upper(), e)
+                    result = {
                         'service': service,
                         'success': False,
                         'error': str(e)
                     }
+                    results[service] = result
+
+                if (pending and not result.get('success')
+                        and _FATAL_ERROR_RE.search(str(result.get('error', '')))):
+                    logger.error("Fatal error in %s assessment, "
+                                 "cancelling remaining services", service.upper())
+                    # Best effort: futures already running cannot be
+                    # cancelled and are awaited normally.
+                    for pending_future in list(pending):
+                        if pending_future.cancel():
+                            pending.discard(pending_future)
+                            cancelled = future_to_service[pending_future]
+                            results[cancelled] = {
+                                'service': cancelled,
+                                'success': False,
+                                'error': f'Cancelled after fatal error in {service}'
+                            }
         
         total_duration = time.time() - total_start_time
         results['total_duration'] = total_duration
         
         return results
 
-    def generate_summary_report(self, results: dict, output_file: str):
-        """Generate a summary report of all assessments."""
+    def generate_summary_report(self, results: dict, output_file: str) -> tuple:
+        """Generate a summary report of all assessments.
+
+        Returns (successful_services, failed_services) so callers can reuse
+        the classification instead of rescanning the results dict.
+        """
+        # Build the whole report in memory (a few KB) and write it with a
+        # single call instead of dozens of small f.write() syscalls.
+        parts = []
+        parts.append("GCP MASTER ASSESSMENT SUMMARY REPORT\n")
+        parts.append("=" * 50 + "\n")
+        parts.append(f"Assessment Date: {self.run_ts_human}\n")
+        parts.append(f"Total Duration: {results.get('total_duration', 0):.2f} seconds\n\n")
+
+        # Service results
+        services = ['compute', 'networking', 'storage', 'gke']
+        successful_services = []
+        failed_services = []
+
+        for service in services:
+            if service in results:
+                result = results[service]
+                status = "SUCCESS" if result['success'] else "FAILED"
+                duration = result.get('duration', 0)
+
+                parts.append(f"{service.upper()} Assessment: {status}\n")
+                if result['success']:
+                    parts.append(f"  Duration: {duration:.2f} seconds\n")
+                    successful_services.append(service)
+                else:
+                    parts.append(f"  Error: {result.get('error', 'Unknown error')}\n")
+                    failed_services.append(service)
+                parts.append("\n")
+
+        # Summary
+        parts.append("SUMMARY\n")
+        parts.append("-" * 20 + "\n")
+        parts.append(f"Successful assessments: {len(successful_services)}/{len(services)}\n")
+        parts.append(f"Successful services: {', '.join(successful_services)}\n")
+        if failed_services:
+            parts.append(f"Failed services: {', '.join(failed_services)}\n")
+
+        # Generated files
+        parts.append("\nGENERATED FILES\n")
+        parts.append("-" * 20 + "\n")
+        parts.append("Check the current directory for the following file patterns:\n")
+        parts.append("- gcp_compute_inventory_*.csv\n")
+        parts.append("- gcp_compute_utilization_*.csv\n")
+        parts.append("- gcp_networking_*_*.csv\n")
+        parts.append("- gcp_storage_*_*.csv\n")
+        parts.append("- gcp_gke_*_*.csv\n")
+        parts.append("- *.log (assessment logs)\n")
+
         with open(output_file, 'w') as f:
-            f.write("GCP MASTER ASSESSMENT SUMMARY REPORT\n")
-            f.write("=" * 50 + "\n")
-            f.write(f"Assessment Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}\n")
-            f.write(f"Total Duration: {results.get('total_duration', 0):.2f} seconds\n\n")
-            
-            # Service results
-            services = ['compute', 'networking', 'storage', 'gke']
-            successful_services = []
-            failed_services = []
-            
-            for service in services:
-                if service in results:
-                    result = results[service]
-                    status = "SUCCESS" if result['success'] else "FAILED"
-                    duration = result.get('duration', 0)
-                    
-                    f.write(f"{service.upper()} Assessment: {status}\n")
-                    if result['success']:
-                        f.write(f"  Duration: {duration:.2f} seconds\n")
-                        successful_services.append(service)
-                    else:
-                        f.write(f"  Error: {result.get('error', 'Unknown error')}\n")
-                        failed_services.append(service)
-                    f.write("\n")
-            
-            # Summary
-            f.write("SUMMARY\n")
-            f.write("-" * 20 + "\n")
-            f.write(f"Successful assessments: {len(successful_services)}/{len(services)}\n")
-            f.write(f"Successful services: {', '.join(successful_services)}\n")
-            if failed_services:
-                f.write(f"Failed services: {', '.join(failed_services)}\n")
-            
-            # Generated files
-            f.write("\nGENERATED FILES\n")
-            f.write("-" * 20 + "\n")
-            f.write("Check the current directory for the following file patterns:\n")
-            f.write("- gcp_compute_inventory_*.csv\n")
-            f.write("- gcp_compute_utilization_*.csv\n")
-            f.write("- gcp_networking_*_*.csv\n")
-            f.write("- gcp_storage_*_*.csv\n")
-            f.write("- gcp_gke_*_*.csv\n")
-            f.write("- *.log (assessment logs)\n")
-        
-        logger.info(f"Summary report generated: {output_file}")
+            f.write(''.join(parts))
+
+        logger.info("Summary report generated: %s", output_file)
+
+        return successful_services, failed_services
 
 def main():
     parser = argparse.ArgumentParser(
@@ -243,6 +802,9 @@ Examples:
     # Execution options
     parser.add_argument('--parallel', action='store_true',
                        help='Run assessments in parallel (default: sequential)')
+    parser.add_argument('--shard-projects', action='store_true',
+                       help='With --parallel, split the project list across '
+                            'max-workers shards per service and merge the CSVs')
     parser.add_argument('--max-workers', type=int, default=10,
                        help='Maximum parallel workers per assessment')
     parser.add_argument('--timeout', type=int, default=3600,
@@ -266,8 +828,8 @@ Examples:
     # Validate services
     invalid_services = [s for s in requested_services if s not in available_services]
     if invalid_services:
-        logger.error(f"Invalid services: {', '.join(invalid_services)}")
-        logger.error(f"Available services: {', '.join(available_services)}")
+        logger.error("Invalid services: %s", ', '.join(invalid_services))
+        logger.error("Available services: %s", ', '.join(available_services))
         sys.exit(1)
     
     # Validate scope
@@ -275,8 +837,8 @@ Examples:
         logger.warning("No scope specified. Will assess all accessible projects.")
     
     logger.info("Starting GCP Master Assessment")
-    logger.info(f"Services to assess: {', '.join(requested_services)}")
-    logger.info(f"Execution mode: {'Parallel' if args.parallel else 'Sequential'}")
+    logger.info("Services to assess: %s", ', '.join(requested_services))
+    logger.info("Execution mode: %s", 'Parallel' if args.parallel else 'Sequential')
     
     # Initialize assessor
     assessor = GCPMasterAssessor()
@@ -288,17 +850,17 @@ Examples:
         results = assessor.run_sequential_assessment(requested_services, args)
     
     # Generate summary report
-    assessor.generate_summary_report(results, args.summary_report)
-    
+    successful_services, _ = assessor.generate_summary_report(results, args.summary_report)
+
     # Final summary
-    successful_count = sum(1 for service in requested_services if results.get(service, {}).get('success', False))
+    successful_count = len(successful_services)
     total_count = len(requested_services)
     
     logger.info("="*60)
     logger.info("GCP MASTER ASSESSMENT COMPLETED")
-    logger.info(f"Successful assessments: {successful_count}/{total_count}")
-    logger.info(f"Total duration: {results.get('total_duration', 0):.2f} seconds")
-    logger.info(f"Summary report: {args.summary_report}")
+    logger.info("Successful assessments: %s/%s", successful_count, total_count)
+    logger.info("Total duration: %.2f seconds", results.get('total_duration', 0))
+    logger.info("Summary report: %s", args.summary_report)
     logger.info("="*60)
     
     # Exit with appropriate code
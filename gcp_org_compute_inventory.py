@@ -9,9 +9,11 @@ Version: 1.0
 
 import csv
 import json
+import re
 import subprocess
 import sys
 import os
+import threading
 import time
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
@@ -19,6 +21,43 @@ import argparse
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
 
+# Optional native client: with google-cloud-compute installed the
+# instance/machine-type/disk lookups go through gRPC on one authenticated
+# channel instead of forking a gcloud subprocess (CLI startup plus a JSON
+# round-trip) for every resource. gcloud remains the fallback throughout.
+try:
+    from google.cloud import compute_v1
+except ImportError:
+    compute_v1 = None
+
+# Optional: with google-auth installed, instance listing can go over a
+# reused AuthorizedSession to compute.googleapis.com — one token refresh
+# and a pooled keep-alive connection instead of a gcloud process (config
+# parse, ADC load, interpreter start) per call. Covers environments that
+# have google-auth but not the full google-cloud-compute client.
+try:
+    import google.auth
+    import google.auth.transport.requests
+    from google.auth.transport.requests import AuthorizedSession
+except ImportError:
+    google = None
+    AuthorizedSession = None
+
+# Optional: with google-cloud-monitoring installed, CPU utilization for a
+# whole project is pulled in one MQL query instead of per-instance
+# monitoring subprocesses.
+try:
+    from google.cloud import monitoring_v3
+except ImportError:
+    monitoring_v3 = None
+
+# Optional: orjson's C parser is several times faster than the stdlib
+# json module on the multi-MB instance lists large projects return.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -30,36 +69,309 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+def _json_loads(data):
+    """Parse JSON with the fastest available parser (accepts bytes)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Version-extraction patterns for parse_os_from_image_name, compiled once
+# at import instead of inside the per-image branches.
+_UBUNTU_VERSION_RE = re.compile(r'(\d{2})(\d{2})')
+_DEBIAN_VERSION_RE = re.compile(r'debian-(\d+)')
+_CENTOS_VERSION_RE = re.compile(r'centos-(\d+)')
+_WINDOWS_VERSION_RE = re.compile(r'(\d{4})')
+_GENERIC_VERSION_RE = re.compile(r'(\d+)')
+
+# OS-family dispatch for parse_os_from_image_name: (family markers,
+# family name, ordered (marker, version) pairs, regex fallback when no
+# pair matches). Built once so the parse is a single scan of the table
+# instead of a long if/elif chain re-testing the image name.
+_OS_TABLE = (
+    (('ubuntu',), 'Ubuntu',
+     (('2004', '20.04 LTS (Focal)'), ('focal', '20.04 LTS (Focal)'),
+      ('2204', '22.04 LTS (Jammy)'), ('jammy', '22.04 LTS (Jammy)'),
+      ('1804', '18.04 LTS (Bionic)'), ('bionic', '18.04 LTS (Bionic)'),
+      ('1604', '16.04 LTS (Xenial)'), ('xenial', '16.04 LTS (Xenial)')),
+     _UBUNTU_VERSION_RE),
+    (('debian',), 'Debian',
+     (('debian-11', '11 (Bullseye)'), ('bullseye', '11 (Bullseye)'),
+      ('debian-10', '10 (Buster)'), ('buster', '10 (Buster)'),
+      ('debian-9', '9 (Stretch)'), ('stretch', '9 (Stretch)')),
+     _DEBIAN_VERSION_RE),
+    (('centos',), 'CentOS',
+     (('centos-7', '7'), ('centos-8', '8'), ('centos-stream', 'Stream')),
+     _CENTOS_VERSION_RE),
+    (('rhel', 'red-hat'), 'Red Hat Enterprise Linux', (), _GENERIC_VERSION_RE),
+    (('windows',), 'Windows Server',
+     (('2019', '2019'), ('2016', '2016'), ('2012', '2012'), ('2022', '2022')),
+     _WINDOWS_VERSION_RE),
+    (('suse', 'sles'), 'SUSE Linux Enterprise Server', (), _GENERIC_VERSION_RE),
+    (('fedora',), 'Fedora', (), _GENERIC_VERSION_RE),
+    (('rocky',), 'Rocky Linux', (), _GENERIC_VERSION_RE),
+    (('alma',), 'AlmaLinux', (), _GENERIC_VERSION_RE),
+    (('cos', 'container-optimized'), 'Container-Optimized OS', (), _GENERIC_VERSION_RE),
+)
+
+INVENTORY_FIELDNAMES = [
+    'organization_id', 'project_id', 'project_name', 'project_number',
+    'instance_name', 'zone', 'region', 'status', 'machine_type',
+    'vcpus', 'memory_gb', 'total_storage_gb', 'disk_count',
+    'storage_types', 'boot_disk_type', 'boot_disk_size_gb',
+    'internal_ip', 'external_ip',
+    'os_family', 'os_version', 'os_architecture', 'boot_disk_image',
+    'runtime_hours_30d', 'uptime_percentage_30d',
+    'creation_timestamp', 'labels', 'tags',
+    'service_accounts', 'preemptible', 'deletion_protection'
+]
+
+UTILIZATION_FIELDNAMES = [
+    'organization_id', 'project_id', 'project_name', 'instance_name',
+    'zone', 'region', 'cpu_avg_30d', 'cpu_max_30d',
+    'memory_avg_30d', 'memory_max_30d', 'data_collection_date'
+]
+
+# Compute API per-project read quota is generous; the limiter only exists
+# to keep a wide thread fan-out from bursting past it.
+API_RATE_PER_SEC = 50
+API_BURST = 100
+
+
+class RateLimiter:
+    """Token-bucket limiter shared by all worker threads.
+
+    Unlike the fixed per-call sleep it replaces, tokens refill
+    continuously at ``rate_per_sec`` and a caller only blocks once the
+    bucket runs dry — runs below the quota never wait.
+    """
+
+    def __init__(self, rate_per_sec: float, burst: Optional[float] = None):
+        self.rate = rate_per_sec
+        self.burst = burst if burst is not None else rate_per_sec
+        self._tokens = self.burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
 class GCPComputeAssessor:
     def __init__(self, organization_id: Optional[str] = None, folder_id: Optional[str] = None, project_ids: Optional[List[str]] = None):
         self.organization_id = organization_id or os.getenv('GCP_ORGANIZATION_ID')
         self.folder_id = folder_id or os.getenv('GCP_FOLDER_ID')
         self.project_ids = project_ids or []
         self.max_workers = 10  # Parallel processing limit
-        self.request_delay = 0.1  # Delay between requests to avoid rate limits
-        
+        self._rate_limiter = RateLimiter(rate_per_sec=API_RATE_PER_SEC, burst=API_BURST)
+        self._sdk_clients = {}
+        self._sdk_lock = threading.Lock()
+        # Machine-type specs are identical across projects, and an org
+        # typically uses a handful of distinct shapes across thousands of
+        # VMs, so describe results are cached per (zone, machine type).
+        # A racing duplicate fetch is harmless, so no lock is needed.
+        self._machine_type_cache = {}
+        # Raw disk-describe payloads keyed by (project, zone, disk): the
+        # boot disk is needed by both the storage and the OS passes, and
+        # the cache collapses those into one describe per disk.
+        self._disk_describe_cache = {}
+        # Orgs deploy from a small set of golden images, so the OS parse
+        # for an image name is done once and reused for every VM on it.
+        self._os_parse_cache = {}
+        self._authed_session = None
+        # The 30-day monitoring window is fixed for the whole assessment,
+        # so its boundary timestamps are formatted once rather than per
+        # instance.
+        now = datetime.utcnow()
+        self._window_end_str = now.strftime('%Y-%m-%dT%H:%M:%SZ')
+        self._window_start_str = (now - timedelta(days=30)).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+    def _get_sdk_client(self, client_name: str):
+        """Return a lazily created compute_v1 client, shared across threads."""
+        if compute_v1 is None:
+            return None
+        with self._sdk_lock:
+            client = self._sdk_clients.get(client_name)
+            if client is None:
+                client = getattr(compute_v1, client_name)()
+                self._sdk_clients[client_name] = client
+        return client
+
+    @staticmethod
+    def _message_to_dict(message) -> Dict:
+        """Convert a proto message to the camelCase dict gcloud would emit."""
+        return json.loads(type(message).to_json(message))
+
+    def _sdk_get(self, client_name: str, **kwargs) -> Optional[Dict]:
+        """Fetch one resource with the native client.
+
+        Returns None when the client is unavailable or the call fails, so
+        the caller falls back to gcloud.
+        """
+        client = self._get_sdk_client(client_name)
+        if client is None:
+            return None
+        try:
+            return self._message_to_dict(client.get(**kwargs))
+        except Exception as e:
+            logger.debug(f"{client_name} get failed ({e}), falling back to gcloud")
+            return None
+
+    def _get_metric_client(self):
+        """Return one lazily created MetricServiceClient, or None."""
+        if monitoring_v3 is None:
+            return None
+        with self._sdk_lock:
+            client = self._sdk_clients.get('MetricServiceClient')
+            if client is None:
+                client = monitoring_v3.MetricServiceClient()
+                self._sdk_clients['MetricServiceClient'] = client
+        return client
+
+    def _query_project_utilization(self, project_id: str) -> Optional[Dict[str, Dict[str, str]]]:
+        """Fetch 30-day CPU utilization for every instance in a project.
+
+        One MQL query replaces the two monitoring subprocesses the
+        per-instance path pays; the result maps instance name to the same
+        utilization dict shape get_instance_utilization returns. Returns
+        None when the monitoring client is unavailable or the query
+        fails, so the caller falls back to the per-instance path.
+        """
+        client = self._get_metric_client()
+        if client is None:
+            return None
+        query = (
+            "fetch gce_instance"
+            " | metric 'compute.googleapis.com/instance/cpu/utilization'"
+            " | within 30d"
+            " | group_by [metric.instance_name],"
+            " [value_utilization_mean: mean(value.utilization),"
+            " value_utilization_max: max(value.utilization)]"
+        )
+        try:
+            series = client.query_time_series(
+                monitoring_v3.QueryTimeSeriesRequest(
+                    name=f"projects/{project_id}", query=query))
+            utilization = {}
+            for ts in series:
+                if not ts.label_values or not ts.point_data:
+                    continue
+                instance_name = ts.label_values[0].string_value
+                mean_value, max_value = (v.double_value for v in ts.point_data[0].values)
+                utilization[instance_name] = {
+                    'cpu_avg': f"{mean_value * 100:.2f}%",
+                    'cpu_max': f"{max_value * 100:.2f}%",
+                    'memory_avg': 'N/A',
+                    'memory_max': 'N/A'
+                }
+            return utilization
+        except Exception as e:
+            logger.debug(f"Monitoring query failed for {project_id} ({e}), using per-instance path")
+            return None
+
+    def _get_authed_session(self):
+        """Return one lazily created AuthorizedSession, or None.
+
+        The session holds the refreshed ADC token and a pooled keep-alive
+        connection, so repeated REST calls skip the per-call TLS handshake
+        and token refresh a fresh client (or gcloud process) would pay.
+        """
+        if AuthorizedSession is None:
+            return None
+        with self._sdk_lock:
+            if self._authed_session is None:
+                try:
+                    credentials, _ = google.auth.default(
+                        scopes=["https://www.googleapis.com/auth/cloud-platform"])
+                    self._authed_session = AuthorizedSession(credentials)
+                except Exception as e:
+                    logger.debug(f"Could not build authorized session: {e}")
+                    return None
+        return self._authed_session
+
+    def _rest_aggregated_instances(self, project_id: str) -> Optional[List[Dict]]:
+        """List a project's instances via the Compute REST API.
+
+        Middle fallback between the native client and gcloud: used when
+        google-cloud-compute is absent but ADC are available. Returns None
+        on any failure so the caller falls back to gcloud.
+        """
+        session = self._get_authed_session()
+        if session is None:
+            return None
+        url = (f"https://compute.googleapis.com/compute/v1/projects/"
+               f"{project_id}/aggregated/instances")
+        params = {}
+        instances = []
+        try:
+            while True:
+                response = session.get(url, params=params, timeout=30)
+                response.raise_for_status()
+                payload = response.json()
+                for scoped in (payload.get('items') or {}).values():
+                    instances.extend(scoped.get('instances', []))
+                token = payload.get('nextPageToken')
+                if not token:
+                    return instances
+                params = {'pageToken': token}
+        except Exception as e:
+            logger.debug(f"REST instance list failed for {project_id} ({e}), falling back to gcloud")
+            return None
+
+    def _sdk_aggregated_list(self, client_name: str, project_id: str,
+                             scoped_attr: str) -> Optional[List[Dict]]:
+        """List a resource type across all zones in one paginated RPC.
+
+        Returns None when the client is unavailable or the call fails, so
+        the caller falls back to gcloud.
+        """
+        client = self._get_sdk_client(client_name)
+        if client is None:
+            return None
+        try:
+            items = []
+            for _, scoped in client.aggregated_list(project=project_id):
+                items.extend(getattr(scoped, scoped_attr, []) or [])
+            return [self._message_to_dict(item) for item in items]
+        except Exception as e:
+            logger.debug(f"{client_name} list failed for {project_id} ({e}), falling back to gcloud")
+            return None
+
     def run_gcloud_command(self, command: List[str], timeout: int = 300) -> Dict[Any, Any]:
         """Execute gcloud command and return JSON output with error handling."""
         try:
+            self._rate_limiter.acquire()
             logger.debug(f"Executing: {' '.join(command)}")
+            # stdout stays as bytes: both orjson and the stdlib parser
+            # accept them directly, so the payload skips a UTF-8
+            # decode/re-encode round trip.
             result = subprocess.run(
                 command,
                 capture_output=True,
-                text=True,
                 check=True,
                 timeout=timeout
             )
-            
+
             if result.stdout.strip():
-                return json.loads(result.stdout)
+                return _json_loads(result.stdout)
             return {}
-            
+
         except subprocess.TimeoutExpired:
             logger.error(f"Command timed out: {' '.join(command)}")
             return {}
         except subprocess.CalledProcessError as e:
             logger.error(f"Command failed: {' '.join(command)}")
-            logger.error(f"Error: {e.stderr}")
+            logger.error(f"Error: {e.stderr.decode('utf-8', errors='replace')}")
             return {}
         except json.JSONDecodeError as e:
             logger.error(f"JSON parsing error: {e}")
@@ -151,18 +463,18 @@ class GCPComputeAssessor:
 
     def get_project_compute_instances(self, project_id: str) -> List[Dict]:
         """Get all compute instances for a specific project."""
-        command = [
-            "gcloud", "compute", "instances", "list",
-            f"--project={project_id}",
-            "--format=json"
-        ]
-        
-        instances = self.run_gcloud_command(command)
+        instances = self._sdk_aggregated_list('InstancesClient', project_id, 'instances')
+        if instances is None:
+            instances = self._rest_aggregated_instances(project_id)
+        if instances is None:
+            command = [
+                "gcloud", "compute", "instances", "list",
+                f"--project={project_id}",
+                "--format=json"
+            ]
+            instances = self.run_gcloud_command(command)
         if instances:
             logger.debug(f"Found {len(instances)} instances in project {project_id}")
-        
-        # Add delay to avoid rate limits
-        time.sleep(self.request_delay)
         return instances if instances else []
 
     def parse_machine_type(self, machine_type_url: str, project_id: str) -> Dict[str, str]:
@@ -170,23 +482,31 @@ class GCPComputeAssessor:
         try:
             machine_type = machine_type_url.split('/')[-1]
             zone = machine_type_url.split('/')[-3]
-            
-            command = [
-                "gcloud", "compute", "machine-types", "describe", machine_type,
-                f"--zone={zone}",
-                f"--project={project_id}",
-                "--format=json"
-            ]
-            
-            machine_details = self.run_gcloud_command(command)
+
+            cached = self._machine_type_cache.get((zone, machine_type))
+            if cached is not None:
+                return cached
+
+            machine_details = self._sdk_get('MachineTypesClient', project=project_id,
+                                            zone=zone, machine_type=machine_type)
+            if machine_details is None:
+                command = [
+                    "gcloud", "compute", "machine-types", "describe", machine_type,
+                    f"--zone={zone}",
+                    f"--project={project_id}",
+                    "--format=json"
+                ]
+                machine_details = self.run_gcloud_command(command)
             
             if machine_details:
-                return {
+                parsed = {
                     'machine_type': machine_type,
                     'vcpus': str(machine_details.get('guestCpus', 'N/A')),
                     'memory_mb': str(machine_details.get('memoryMb', 'N/A')),
                     'memory_gb': str(round(int(machine_details.get('memoryMb', 0)) / 1024, 2)) if machine_details.get('memoryMb') else 'N/A'
                 }
+                self._machine_type_cache[(zone, machine_type)] = parsed
+                return parsed
             
         except Exception as e:
             logger.error(f"Error parsing machine type {machine_type_url}: {e}")
@@ -200,48 +520,83 @@ class GCPComputeAssessor:
             'memory_gb': 'N/A'
         }
 
+    def _describe_disk_payload(self, project_id: str, disk_zone: str,
+                               disk_name: str) -> Optional[Dict]:
+        """Return the raw describe payload for one disk, memoized.
+
+        get_disk_info and get_os_information both need the boot disk's
+        payload; the cache means each disk is described once per run.
+        Failures are not cached so a transient error can be retried.
+        """
+        cache_key = (project_id, disk_zone, disk_name)
+        disk_info = self._disk_describe_cache.get(cache_key)
+        if disk_info is not None:
+            return disk_info
+
+        disk_info = self._sdk_get('DisksClient', project=project_id,
+                                  zone=disk_zone, disk=disk_name)
+        if disk_info is None:
+            command = [
+                "gcloud", "compute", "disks", "describe", disk_name,
+                f"--zone={disk_zone}",
+                f"--project={project_id}",
+                "--format=json"
+            ]
+            disk_info = self.run_gcloud_command(command)
+        if disk_info:
+            self._disk_describe_cache[cache_key] = disk_info
+        return disk_info or None
+
+    def _describe_disk(self, disk: Dict, project_id: str) -> Optional[Dict[str, Any]]:
+        """Describe one attached disk and return its detail record."""
+        try:
+            disk_name = disk['source'].split('/')[-1]
+            disk_zone = disk['source'].split('/')[-3]
+
+            disk_info = self._describe_disk_payload(project_id, disk_zone, disk_name)
+
+            if disk_info:
+                return {
+                    'name': disk_name,
+                    'size_gb': int(disk_info.get('sizeGb', 0)),
+                    'type': disk_info.get('type', 'N/A').split('/')[-1],
+                    'boot': disk.get('boot', False)
+                }
+
+        except Exception as e:
+            logger.error(f"Error getting disk info for {disk.get('source', 'unknown')}: {e}")
+        return None
+
     def get_disk_info(self, disks: List[Dict], project_id: str) -> Dict[str, Any]:
         """Extract disk information from instance disks including storage types."""
         total_storage_gb = 0
         disk_details = []
         storage_types = []
-        
-        for disk in disks:
-            try:
-                disk_name = disk['source'].split('/')[-1]
-                disk_zone = disk['source'].split('/')[-3]
-                
-                command = [
-                    "gcloud", "compute", "disks", "describe", disk_name,
-                    f"--zone={disk_zone}",
-                    f"--project={project_id}",
-                    "--format=json"
-                ]
-                
-                disk_info = self.run_gcloud_command(command)
-                if disk_info:
-                    size_gb = int(disk_info.get('sizeGb', 0))
-                    disk_type = disk_info.get('type', 'N/A').split('/')[-1]
-                    total_storage_gb += size_gb
-                    
-                    disk_details.append({
-                        'name': disk_name,
-                        'size_gb': size_gb,
-                        'type': disk_type,
-                        'boot': disk.get('boot', False)
-                    })
-                    
-                    # Collect storage types
-                    if disk_type not in storage_types:
-                        storage_types.append(disk_type)
-                
-                # Small delay to avoid rate limits
-                time.sleep(self.request_delay)
-                
-            except Exception as e:
-                logger.error(f"Error getting disk info for {disk.get('source', 'unknown')}: {e}")
+
+        # Describe attached disks concurrently; VMs with several data disks
+        # otherwise pay the describe latency serially. Results are collected
+        # back in attachment order so boot-disk lookups and the joined
+        # storage_types column stay deterministic.
+        if len(disks) > 1:
+            results = [None] * len(disks)
+            with ThreadPoolExecutor(max_workers=min(8, len(disks))) as executor:
+                future_to_index = {
+                    executor.submit(self._describe_disk, disk, project_id): i
+                    for i, disk in enumerate(disks)
+                }
+                for future in as_completed(future_to_index):
+                    results[future_to_index[future]] = future.result()
+        else:
+            results = [self._describe_disk(disk, project_id) for disk in disks]
+
+        for detail in results:
+            if detail is None:
                 continue
-        
+            total_storage_gb += detail['size_gb']
+            disk_details.append(detail)
+            if detail['type'] not in storage_types:
+                storage_types.append(detail['type'])
+
         return {
             'total_storage_gb': total_storage_gb,
             'disk_count': len(disk_details),
@@ -253,13 +608,6 @@ class GCPComputeAssessor:
 
     def get_instance_utilization(self, project_id: str, instance_name: str, zone: str) -> Dict[str, str]:
         """Get CPU and memory utilization for the last 30 days using gcloud monitoring."""
-        end_time = datetime.utcnow()
-        start_time = end_time - timedelta(days=30)
-        
-        # Format timestamps for Cloud Monitoring
-        start_time_str = start_time.strftime('%Y-%m-%dT%H:%M:%SZ')
-        end_time_str = end_time.strftime('%Y-%m-%dT%H:%M:%SZ')
-        
         utilization_data = {
             'cpu_avg': 'N/A',
             'cpu_max': 'N/A',
@@ -275,8 +623,8 @@ class GCPComputeAssessor:
                 "--filter=metric.type=\"compute.googleapis.com/instance/cpu/utilization\"",
                 f"--filter=resource.labels.instance_name=\"{instance_name}\"",
                 f"--filter=resource.labels.zone=\"{zone}\"",
-                f"--interval.start-time={start_time_str}",
-                f"--interval.end-time={end_time_str}",
+                f"--interval.start-time={self._window_start_str}",
+                f"--interval.end-time={self._window_end_str}",
                 "--format=json",
                 "--limit=1000"
             ]
@@ -299,136 +647,6 @@ class GCPComputeAssessor:
         
         return utilization_data
 
-    def get_os_information(self, instance: Dict, project_id: str) -> Dict[str, str]:
-        """Extract OS information from instance boot disk."""
-        os_info = {
-            'os_family': 'N/A',
-            'os_version': 'N/A',
-            'os_architecture': 'N/A',
-            'boot_disk_image': 'N/A'
-        }
-        
-        try:
-            # Find boot disk
-            boot_disk = None
-            for disk in instance.get('disks', []):
-                if disk.get('boot', False):
-                    boot_disk = disk
-                    break
-            
-            if not boot_disk:
-                return os_info
-            
-            # Get boot disk details
-            disk_name = boot_disk['source'].split('/')[-1]
-            disk_zone = boot_disk['source'].split('/')[-3]
-            
-            command = [
-                "gcloud", "compute", "disks", "describe", disk_name,
-                f"--zone={disk_zone}",
-                f"--project={project_id}",
-                "--format=json"
-            ]
-            
-            disk_info = self.run_gcloud_command(command)
-            if disk_info:
-                # Extract OS information from source image
-                source_image = disk_info.get('sourceImage', '')
-                if source_image:
-                    os_info['boot_disk_image'] = source_image.split('/')[-1]
-                    
-                    # Parse OS family and version from image name
-                    image_name = source_image.split('/')[-1].lower()
-                    os_info.update(self.parse_os_from_image_name(image_name))
-            
-            # Small delay to avoid rate limits
-            time.sleep(self.request_delay)
-            
-        except Exception as e:
-            logger.debug(f"Error getting OS information for {instance.get('name', 'unknown')}: {e}")
-        
-        return os_info
-
-    def parse_os_from_image_name(self, image_name: str) -> Dict[str, str]:
-        """Parse OS family and version from GCP image name."""
-        os_details = {
-            'os_family': 'N/A',
-            'os_version': 'N/A',
-            'os_architecture': 'x86_64'
-        }
-        
-        try:
-            # Common GCP image patterns
-            if 'ubuntu' in image_name:
-                os_details['os_family'] = 'Ubuntu'
-                if '2004' in image_name or 'focal' in image_name:
-                    os_details['os_version'] = '20.04 LTS'
-                elif '2204' in image_name or 'jammy' in image_name:
-                    os_details['os_version'] = '22.04 LTS'
-                elif '1804' in image_name or 'bionic' in image_name:
-                    os_details['os_version'] = '18.04 LTS'
-                elif '1604' in image_name or 'xenial' in image_name:
-                    os_details['os_version'] = '16.04 LTS'
-            
-            elif 'debian' in image_name:
-                os_details['os_family'] = 'Debian'
-                if 'debian-11' in image_name or 'bullseye' in image_name:
-                    os_details['os_version'] = '11'
-                elif 'debian-10' in image_name or 'buster' in image_name:
-                    os_details['os_version'] = '10'
-                elif 'debian-9' in image_name or 'stretch' in image_name:
-                    os_details['os_version'] = '9'
-            
-            elif 'centos' in image_name:
-                os_details['os_family'] = 'CentOS'
-                if 'centos-7' in image_name:
-                    os_details['os_version'] = '7'
-                elif 'centos-8' in image_name:
-                    os_details['os_version'] = '8'
-                elif 'centos-stream' in image_name:
-                    os_details['os_version'] = 'Stream'
-            
-            elif 'rhel' in image_name or 'red-hat' in image_name:
-                os_details['os_family'] = 'RHEL'
-                if 'rhel-7' in image_name:
-                    os_details['os_version'] = '7'
-                elif 'rhel-8' in image_name:
-                    os_details['os_version'] = '8'
-                elif 'rhel-9' in image_name:
-                    os_details['os_version'] = '9'
-            
-            elif 'windows' in image_name:
-                os_details['os_family'] = 'Windows Server'
-                if '2019' in image_name:
-                    os_details['os_version'] = '2019'
-                elif '2016' in image_name:
-                    os_details['os_version'] = '2016'
-                elif '2012' in image_name:
-                    os_details['os_version'] = '2012'
-                elif '2022' in image_name:
-                    os_details['os_version'] = '2022'
-            
-            elif 'suse' in image_name or 'sles' in image_name:
-                os_details['os_family'] = 'SUSE'
-                if 'sles-12' in image_name:
-                    os_details['os_version'] = '12'
-                elif 'sles-15' in image_name:
-                    os_details['os_version'] = '15'
-            
-            elif 'cos' in image_name or 'container-optimized' in image_name:
-                os_details['os_family'] = 'Container-Optimized OS'
-            
-            # Check for ARM architecture
-            if 'arm64' in image_name or 'aarch64' in image_name:
-                os_details['os_architecture'] = 'ARM64'
-            elif 'arm' in image_name:
-                os_details['os_architecture'] = 'ARM'
-            
-        except Exception as e:
-            logger.debug(f"Error parsing OS from image name '{image_name}': {e}")
-        
-        return os_details
-
     def get_instance_runtime_hours(self, project_id: str, instance_name: str, zone: str) -> Dict[str, str]:
         """Get instance runtime hours for the last 30 days using Cloud Monitoring."""
         runtime_info = {
@@ -437,13 +655,9 @@ class GCPComputeAssessor:
         }
         
         try:
-            # Calculate 30 days ago
-            end_time = datetime.utcnow()
-            start_time = end_time - timedelta(days=30)
-            
             # Total hours in 30 days
             total_hours = 30 * 24
-            
+
             # For now, we'll estimate based on instance status and creation time
             # In a full implementation, you would query Cloud Monitoring for actual uptime metrics
             
@@ -462,8 +676,13 @@ class GCPComputeAssessor:
         
         return runtime_info
 
-    def get_os_information(self, instance: Dict, project_id: str) -> Dict[str, str]:
-        """Extract OS information from instance and boot disk details."""
+    def get_os_information(self, instance: Dict, project_id: str,
+                           boot_disk: Optional[Dict] = None) -> Dict[str, str]:
+        """Extract OS information from instance and boot disk details.
+
+        Callers that have already located the boot disk pass it in to
+        avoid rescanning the attached-disk list.
+        """
         os_info = {
             'os_family': 'N/A',
             'os_version': 'N/A',
@@ -472,44 +691,41 @@ class GCPComputeAssessor:
             'boot_disk_size_gb': 'N/A',
             'boot_disk_type': 'N/A'
         }
-        
+
         try:
             # Find boot disk
-            boot_disk = None
-            for disk in instance.get('disks', []):
-                if disk.get('boot', False):
-                    boot_disk = disk
-                    break
-            
+            if boot_disk is None:
+                boot_disk = next(
+                    (disk for disk in instance.get('disks', []) if disk.get('boot', False)),
+                    None)
+
             if not boot_disk:
                 logger.warning(f"No boot disk found for instance {instance.get('name', 'unknown')}")
                 return os_info
             
-            # Get boot disk details
+            # Get boot disk details (already cached by get_disk_info's pass)
             disk_name = boot_disk['source'].split('/')[-1]
             disk_zone = boot_disk['source'].split('/')[-3]
-            
-            command = [
-                "gcloud", "compute", "disks", "describe", disk_name,
-                f"--zone={disk_zone}",
-                f"--project={project_id}",
-                "--format=json"
-            ]
-            
-            disk_info = self.run_gcloud_command(command)
+
+            disk_info = self._describe_disk_payload(project_id, disk_zone, disk_name)
             if disk_info:
                 # Extract boot disk information
                 os_info['boot_disk_size_gb'] = str(disk_info.get('sizeGb', 'N/A'))
                 os_info['boot_disk_type'] = disk_info.get('type', 'N/A').split('/')[-1]
-                
+
                 # Extract OS information from source image
                 source_image = disk_info.get('sourceImage', '')
                 if source_image:
                     os_info['boot_disk_image'] = source_image.split('/')[-1]
-                    
-                    # Parse OS family and version from image name
+
+                    # Parse OS family and version from image name (cached:
+                    # the parse is pure string matching per image name)
                     image_name = source_image.split('/')[-1].lower()
-                    os_info.update(self.parse_os_from_image_name(image_name))
+                    parsed = self._os_parse_cache.get(image_name)
+                    if parsed is None:
+                        parsed = self.parse_os_from_image_name(image_name)
+                        self._os_parse_cache[image_name] = parsed
+                    os_info.update(parsed)
                 
                 # Try to get more detailed OS info from guest OS features
                 guest_os_features = disk_info.get('guestOsFeatures', [])
@@ -521,10 +737,7 @@ class GCPComputeAssessor:
                                 os_info['os_family'] = 'Windows'
                         elif 'uefi' in feature_type:
                             os_info['os_architecture'] = 'UEFI'
-            
-            # Small delay to avoid rate limits
-            time.sleep(self.request_delay)
-            
+
         except Exception as e:
             logger.error(f"Error getting OS information for {instance.get('name', 'unknown')}: {e}")
         
@@ -539,110 +752,19 @@ class GCPComputeAssessor:
         }
         
         try:
-            # Common GCP image patterns
-            if 'ubuntu' in image_name:
-                os_details['os_family'] = 'Ubuntu'
-                # Extract version (e.g., ubuntu-2004-focal, ubuntu-1804-bionic)
-                if '2004' in image_name or 'focal' in image_name:
-                    os_details['os_version'] = '20.04 LTS (Focal)'
-                elif '2204' in image_name or 'jammy' in image_name:
-                    os_details['os_version'] = '22.04 LTS (Jammy)'
-                elif '1804' in image_name or 'bionic' in image_name:
-                    os_details['os_version'] = '18.04 LTS (Bionic)'
-                elif '1604' in image_name or 'xenial' in image_name:
-                    os_details['os_version'] = '16.04 LTS (Xenial)'
-                else:
-                    # Try to extract version number
-                    import re
-                    version_match = re.search(r'(\d{2})(\d{2})', image_name)
-                    if version_match:
-                        os_details['os_version'] = f"{version_match.group(1)}.{version_match.group(2)}"
-            
-            elif 'debian' in image_name:
-                os_details['os_family'] = 'Debian'
-                if 'debian-11' in image_name or 'bullseye' in image_name:
-                    os_details['os_version'] = '11 (Bullseye)'
-                elif 'debian-10' in image_name or 'buster' in image_name:
-                    os_details['os_version'] = '10 (Buster)'
-                elif 'debian-9' in image_name or 'stretch' in image_name:
-                    os_details['os_version'] = '9 (Stretch)'
-                else:
-                    import re
-                    version_match = re.search(r'debian-(\d+)', image_name)
-                    if version_match:
-                        os_details['os_version'] = version_match.group(1)
-            
-            elif 'centos' in image_name:
-                os_details['os_family'] = 'CentOS'
-                if 'centos-7' in image_name:
-                    os_details['os_version'] = '7'
-                elif 'centos-8' in image_name:
-                    os_details['os_version'] = '8'
-                elif 'centos-stream' in image_name:
-                    os_details['os_version'] = 'Stream'
-                else:
-                    import re
-                    version_match = re.search(r'centos-(\d+)', image_name)
-                    if version_match:
-                        os_details['os_version'] = version_match.group(1)
-            
-            elif 'rhel' in image_name or 'red-hat' in image_name:
-                os_details['os_family'] = 'Red Hat Enterprise Linux'
-                import re
-                version_match = re.search(r'(\d+)', image_name)
-                if version_match:
-                    os_details['os_version'] = version_match.group(1)
-            
-            elif 'windows' in image_name:
-                os_details['os_family'] = 'Windows Server'
-                if '2019' in image_name:
-                    os_details['os_version'] = '2019'
-                elif '2016' in image_name:
-                    os_details['os_version'] = '2016'
-                elif '2012' in image_name:
-                    os_details['os_version'] = '2012'
-                elif '2022' in image_name:
-                    os_details['os_version'] = '2022'
-                else:
-                    import re
-                    version_match = re.search(r'(\d{4})', image_name)
-                    if version_match:
-                        os_details['os_version'] = version_match.group(1)
-            
-            elif 'suse' in image_name or 'sles' in image_name:
-                os_details['os_family'] = 'SUSE Linux Enterprise Server'
-                import re
-                version_match = re.search(r'(\d+)', image_name)
-                if version_match:
-                    os_details['os_version'] = version_match.group(1)
-            
-            elif 'fedora' in image_name:
-                os_details['os_family'] = 'Fedora'
-                import re
-                version_match = re.search(r'(\d+)', image_name)
-                if version_match:
-                    os_details['os_version'] = version_match.group(1)
-            
-            elif 'rocky' in image_name:
-                os_details['os_family'] = 'Rocky Linux'
-                import re
-                version_match = re.search(r'(\d+)', image_name)
-                if version_match:
-                    os_details['os_version'] = version_match.group(1)
-            
-            elif 'alma' in image_name:
-                os_details['os_family'] = 'AlmaLinux'
-                import re
-                version_match = re.search(r'(\d+)', image_name)
-                if version_match:
-                    os_details['os_version'] = version_match.group(1)
-            
-            elif 'cos' in image_name or 'container-optimized' in image_name:
-                os_details['os_family'] = 'Container-Optimized OS'
-                import re
-                version_match = re.search(r'(\d+)', image_name)
-                if version_match:
-                    os_details['os_version'] = version_match.group(1)
+            for markers, family, versions, version_re in _OS_TABLE:
+                if any(marker in image_name for marker in markers):
+                    os_details['os_family'] = family
+                    for marker, version in versions:
+                        if marker in image_name:
+                            os_details['os_version'] = version
+                            break
+                    else:
+                        # Fall back to extracting a bare version number
+                        version_match = version_re.search(image_name)
+                        if version_match:
+                            os_details['os_version'] = '.'.join(version_match.groups())
+                    break
             
             # Check for ARM architecture
             if 'arm64' in image_name or 'aarch64' in image_name:
@@ -672,7 +794,12 @@ class GCPComputeAssessor:
                 return project_instances, project_utilization
             
             logger.info(f"Found {len(instances)} instances in {project_id}")
-            
+
+            # Fetched lazily on the first RUNNING instance: one project-wide
+            # monitoring query serves every instance lookup below.
+            utilization_map = None
+            utilization_fetched = False
+
             for instance in instances:
                 try:
                     instance_name = instance['name']
@@ -682,10 +809,13 @@ class GCPComputeAssessor:
                     
                     # Get machine type details
                     machine_info = self.parse_machine_type(instance['machineType'], project_id)
-                    
-                    # Get disk information
-                    disk_info = self.get_disk_info(instance.get('disks', []), project_id)
-                    
+
+                    # Get disk information; the boot disk is located once
+                    # here and handed to the OS lookup below.
+                    disks = instance.get('disks', [])
+                    boot_disk = next((disk for disk in disks if disk.get('boot', False)), None)
+                    disk_info = self.get_disk_info(disks, project_id)
+
                     # Get network information
                     internal_ip = instance.get('networkInterfaces', [{}])[0].get('networkIP', 'N/A')
                     external_ip = 'N/A'
@@ -693,7 +823,7 @@ class GCPComputeAssessor:
                         external_ip = instance['networkInterfaces'][0]['accessConfigs'][0].get('natIP', 'N/A')
                     
                     # Get OS information
-                    os_info = self.get_os_information(instance, project_id)
+                    os_info = self.get_os_information(instance, project_id, boot_disk=boot_disk)
                     
                     # Get runtime information
                     runtime_info = self.get_instance_runtime_hours(project_id, instance_name, zone)
@@ -736,7 +866,18 @@ class GCPComputeAssessor:
                     
                     # Get utilization data (only for running instances)
                     if instance['status'] == 'RUNNING':
-                        utilization = self.get_instance_utilization(project_id, instance_name, zone)
+                        if not utilization_fetched:
+                            utilization_map = self._query_project_utilization(project_id)
+                            utilization_fetched = True
+                        if utilization_map is not None:
+                            utilization = utilization_map.get(instance_name, {
+                                'cpu_avg': 'N/A',
+                                'cpu_max': 'N/A',
+                                'memory_avg': 'N/A',
+                                'memory_max': 'N/A'
+                            })
+                        else:
+                            utilization = self.get_instance_utilization(project_id, instance_name, zone)
                         
                         utilization_data = {
                             'organization_id': self.organization_id or 'N/A',
@@ -763,52 +904,10 @@ class GCPComputeAssessor:
         
         return project_instances, project_utilization
 
-    def export_inventory_csv(self, instances_data: List[Dict], filename: str):
-        """Export instance inventory to CSV file."""
-        if not instances_data:
-            logger.warning("No inventory data to export")
-            return
-            
-        fieldnames = [
-            'organization_id', 'project_id', 'project_name', 'project_number',
-            'instance_name', 'zone', 'region', 'status', 'machine_type',
-            'vcpus', 'memory_gb', 'total_storage_gb', 'disk_count',
-            'storage_types', 'boot_disk_type', 'boot_disk_size_gb',
-            'internal_ip', 'external_ip', 
-            'os_family', 'os_version', 'os_architecture', 'boot_disk_image',
-            'runtime_hours_30d', 'uptime_percentage_30d',
-            'creation_timestamp', 'labels', 'tags',
-            'service_accounts', 'preemptible', 'deletion_protection'
-        ]
-        
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(instances_data)
-        
-        logger.info(f"Exported {len(instances_data)} instances to {filename}")
-
-    def export_utilization_csv(self, utilization_data: List[Dict], filename: str):
-        """Export utilization data to CSV file."""
-        if not utilization_data:
-            logger.warning("No utilization data to export")
-            return
-            
-        fieldnames = [
-            'organization_id', 'project_id', 'project_name', 'instance_name',
-            'zone', 'region', 'cpu_avg_30d', 'cpu_max_30d',
-            'memory_avg_30d', 'memory_max_30d', 'data_collection_date'
-        ]
-        
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(utilization_data)
-        
-        logger.info(f"Exported {len(utilization_data)} utilization records to {filename}")
-
-    def run_assessment(self, inventory_file: str, utilization_file: str, max_workers: int = 10):
+    def run_assessment(self, inventory_file: str, utilization_file: str, max_workers: Optional[int] = None):
         """Run the complete compute assessment based on specified scope."""
+        if max_workers is None:
+            max_workers = self.max_workers
         if self.project_ids:
             logger.info("Starting GCP Project-Level Compute Engine Assessment")
         elif self.folder_id:
@@ -832,48 +931,77 @@ class GCPComputeAssessor:
         scope_description = self._get_scope_description()
         logger.info(f"Starting assessment of {len(projects)} projects in {scope_description}")
         
-        all_instances_data = []
-        all_utilization_data = []
-        
-        # Process projects in parallel
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all project processing tasks
-            future_to_project = {
-                executor.submit(self.process_project_instances, project): project
-                for project in projects
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_project):
-                project = future_to_project[future]
-                try:
-                    project_instances, project_utilization = future.result()
-                    all_instances_data.extend(project_instances)
-                    all_utilization_data.extend(project_utilization)
-                    
-                    logger.info(f"Completed project {project['project_id']}: "
-                              f"{len(project_instances)} instances, "
-                              f"{len(project_utilization)} utilization records")
-                    
-                except Exception as e:
-                    logger.error(f"Error processing project {project['project_id']}: {e}")
-        
-        # Export results
-        logger.info("Exporting assessment results...")
-        self.export_inventory_csv(all_instances_data, inventory_file)
-        self.export_utilization_csv(all_utilization_data, utilization_file)
-        
+        # Rows are streamed to disk as each project's future completes
+        # instead of being accumulated across the whole run, so peak memory
+        # is bounded by the largest single project rather than the org.
+        # Files are opened lazily on the first row, preserving the old
+        # behaviour of producing no file when there is nothing to export.
+        writers = {}
+        open_files = []
+        row_counts = {'inventory': 0, 'utilization': 0}
+
+        def write_rows(key, filename, fieldnames, rows):
+            if not rows:
+                return
+            writer = writers.get(key)
+            if writer is None:
+                csvfile = open(filename, 'w', newline='', encoding='utf-8')
+                open_files.append(csvfile)
+                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+                writer.writeheader()
+                writers[key] = writer
+            writer.writerows(rows)
+            row_counts[key] += len(rows)
+
+        try:
+            # Process projects in parallel
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Submit all project processing tasks
+                future_to_project = {
+                    executor.submit(self.process_project_instances, project): project
+                    for project in projects
+                }
+
+                # Write results as they complete
+                for future in as_completed(future_to_project):
+                    project = future_to_project[future]
+                    try:
+                        project_instances, project_utilization = future.result()
+                        write_rows('inventory', inventory_file,
+                                   INVENTORY_FIELDNAMES, project_instances)
+                        write_rows('utilization', utilization_file,
+                                   UTILIZATION_FIELDNAMES, project_utilization)
+
+                        logger.info(f"Completed project {project['project_id']}: "
+                                  f"{len(project_instances)} instances, "
+                                  f"{len(project_utilization)} utilization records")
+
+                    except Exception as e:
+                        logger.error(f"Error processing project {project['project_id']}: {e}")
+        finally:
+            for csvfile in open_files:
+                csvfile.close()
+
+        if row_counts['inventory']:
+            logger.info(f"Exported {row_counts['inventory']} instances to {inventory_file}")
+        else:
+            logger.warning("No inventory data to export")
+        if row_counts['utilization']:
+            logger.info(f"Exported {row_counts['utilization']} utilization records to {utilization_file}")
+        else:
+            logger.warning("No utilization data to export")
+
         # Summary
         logger.info("="*60)
         logger.info("ASSESSMENT COMPLETED")
         logger.info(f"Assessment scope: {scope_description}")
         logger.info(f"Projects processed: {len(projects)}")
-        logger.info(f"Total instances found: {len(all_instances_data)}")
-        logger.info(f"Running instances with utilization data: {len(all_utilization_data)}")
+        logger.info(f"Total instances found: {row_counts['inventory']}")
+        logger.info(f"Running instances with utilization data: {row_counts['utilization']}")
         logger.info(f"Inventory file: {inventory_file}")
         logger.info(f"Utilization file: {utilization_file}")
         logger.info("="*60)
-        
+
         return True
 
     def _get_scope_description(self) -> str: